@@ -5,10 +5,34 @@ A hub-and-spoke sync orchestrator supporting multiple backends
 (SFTP, Syncthing, rclone) with remote machine management via SSH.
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 __version__ = "2.0.0"
 __author__ = "Dylan"
 
-from dgmt.core.config import Config
-from dgmt.core.daemon import Daemon
+if TYPE_CHECKING:
+    from dgmt.core.config import Config
+    from dgmt.core.daemon import Daemon
 
 __all__ = ["Config", "Daemon", "__version__"]
+
+# Public names imported on first access (PEP 562), so `import dgmt` (and
+# every CLI start, which reads __version__) doesn't load watchdog, the
+# backends and the daemon.
+_LAZY_ATTRS = {
+    "Config": "dgmt.core.config",
+    "Daemon": "dgmt.core.daemon",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
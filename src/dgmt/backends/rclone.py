@@ -2,14 +2,145 @@
 
 from __future__ import annotations
 
+import functools
+import logging
+import os
+import re
+import shutil
 import subprocess
-import sys
 import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Mapping, Optional, Union
+
+import requests
 
 from dgmt.backends.base import Backend, BackendBuilder
+from dgmt.backends.rclone_rcd import RcloneRcd, RcloneRcdError
 from dgmt.utils.logging import get_logger
+from dgmt.utils.paths import tree_signature
+from dgmt.utils.proc import SUBPROCESS_ARGS, run_streaming
+
+
+# bisync failures that dgmt knows how to recover from
+_RESYNC_RE = re.compile(r"Must run --resync|cannot find prior")
+_MISSING_DIR_RE = re.compile(r"directory not found|doesn't exist", re.IGNORECASE)
+
+# `rclone version` output, e.g. "rclone v1.66.0"
+_VERSION_RE = re.compile(r"rclone v(\d+)\.(\d+)")
+
+# First rclone release whose bisync has both --resilient and --recover
+_BISYNC_RECOVER_VERSION = (1, 66)
+
+# Flag names that set rclone's log verbosity
+_VERBOSITY_FLAGS = frozenset({"--verbose", "-v", "-vv", "--log-level"})
+
+# Repeatable flags (e.g. --exclude) hold a list of values
+FlagMap = dict[str, Union[None, str, list[str]]]
+
+
+def _parse_flags(flags: Union[Iterable[str], Mapping[str, Any]]) -> FlagMap:
+    """
+    Normalise rclone flags to an insertion-ordered {name: value} map.
+
+    Accepts a mapping as-is, or a CLI-style list where values may be
+    attached ('--x=1') or the following item ('--x', '1'). A flag given
+    more than once with values keeps all of them.
+    """
+    if isinstance(flags, Mapping):
+        return dict(flags)
+
+    flag_map: FlagMap = {}
+    items = list(flags)
+    i = 0
+    while i < len(items):
+        name, sep, value = items[i].partition("=")
+        if not sep:
+            if i + 1 < len(items) and not items[i + 1].startswith("-"):
+                value = items[i + 1]
+                i += 1
+            else:
+                value = None
+        i += 1
+
+        previous = flag_map.get(name)
+        if value is not None and previous is not None:
+            if isinstance(previous, list):
+                previous.append(value)
+            else:
+                flag_map[name] = [previous, value]
+        else:
+            flag_map[name] = value
+    return flag_map
+
+
+def _render_flags(flag_map: Mapping[str, Any]) -> list[str]:
+    """Turn a flag map back into argv items."""
+    argv: list[str] = []
+    for name, value in flag_map.items():
+        if value is None:
+            argv.append(name)
+        elif isinstance(value, list):
+            for item in value:
+                argv.extend((name, item))
+        else:
+            argv.extend((name, value))
+    return argv
+
+
+@functools.lru_cache(maxsize=None)
+def _rclone_version(rclone_exe: str) -> Optional[tuple[int, int]]:
+    """Get rclone's (major, minor) version, or None if it can't be determined."""
+    try:
+        result = subprocess.run(
+            [rclone_exe, "version"],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=10,
+            **SUBPROCESS_ARGS,
+        )
+    except (subprocess.SubprocessError, OSError):
+        return None
+    match = _VERSION_RE.search(result.stdout)
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+@functools.lru_cache(maxsize=64)
+def _remote_path_for(remote: str, dest: str, local_path: str) -> str:
+    """Map a local folder to its remote path (remote:dest/<folder name>)."""
+    return f"{remote}:{dest}/{os.path.basename(os.path.normpath(local_path))}"
+
+
+def _relative_posix(path: str, root: str) -> str:
+    """
+    Get path relative to root with '/' separators.
+
+    Plain string work instead of PurePath objects, as this runs for every
+    rename event.
+
+    Raises:
+        ValueError: If path is not inside root.
+    """
+    rel = os.path.relpath(path, root)
+    if rel == os.pardir or rel.startswith(os.pardir + os.sep) or os.path.isabs(rel):
+        raise ValueError(f"{path!r} is not in {root!r}")
+    return rel.replace(os.sep, "/")
+
+
+@dataclass(frozen=True)
+class _PathCommands:
+    """Pre-built remote path and argv for one local folder."""
+
+    remote_path: str
+    bisync_argv: tuple[str, ...]
+    bisync_resync_argv: tuple[str, ...]
+    pull_argv: tuple[str, ...]
+    push_argv: tuple[str, ...]
 
 
 class RcloneBackend(Backend):
@@ -23,45 +154,263 @@ class RcloneBackend(Backend):
         self,
         remote: str = "dgmt",
         dest: str = "Obsidian-Backup",
-        flags: Optional[list[str]] = None,
+        flags: Optional[Union[list[str], Mapping[str, Any]]] = None,
+        transfers: Optional[int] = None,
+        checkers: Optional[int] = None,
+        fast_list: bool = False,
+        drive_chunk_size: Optional[str] = None,
+        multi_thread_streams: Optional[int] = None,
+        use_rcd: bool = True,
+        max_workers: int = 4,
+        health_ttl: float = 30.0,
     ) -> None:
         self._remote = remote
         self._dest = dest
-        self._flags = flags or ["--verbose"]
-        self._lock = threading.Lock()
-        self._first_run = True
+        # Resolve rclone on PATH once and hand every spawn the absolute path
+        # (on Windows this also skips a PATHEXT search per spawn). None means
+        # rclone isn't installed, so health checks can fail without spawning.
+        self._rclone_path = shutil.which("rclone")
+        self._rclone_exe = self._rclone_path or "rclone"
+        # Flags are kept as a {name: value} map so lookups and overrides are
+        # O(1), and rendered to argv once per path in _build_commands
+        self._flag_map = _parse_flags(flags or [])
+
+        # Parallelism/listing tuning applied to every transfer command.
+        # rclone's defaults (4 transfers, 8 checkers) are far too low for
+        # many-small-files trees such as an Obsidian vault.
+        self._transfer_flags: list[str] = []
+        if transfers:
+            self._transfer_flags.extend(["--transfers", str(transfers)])
+        if checkers:
+            self._transfer_flags.extend(["--checkers", str(checkers)])
+        if fast_list:
+            self._transfer_flags.append("--fast-list")
+        if drive_chunk_size:
+            # Backend-specific flag; rclone ignores it for non-Drive remotes
+            self._transfer_flags.extend(["--drive-chunk-size", drive_chunk_size])
+        if multi_thread_streams:
+            # Split large files into parallel ranged transfers
+            self._transfer_flags.extend(["--multi-thread-streams", str(multi_thread_streams)])
+        # One lock per local path: operations on the same folder are serialized,
+        # different folders can run concurrently
+        self._path_locks: dict[str, threading.Lock] = {}
+        self._path_locks_guard = threading.Lock()
+        # Paths that have had their first (--resync) bisync this session.
+        # Tracked per path so every folder gets its own resync, not just
+        # whichever one happens to sync first.
+        self._resynced_paths: set[str] = set()
+        # Follow-up sync() runs waiting for the path lock, keyed by
+        # (local_path, remote_path); later callers join the queued run
+        self._queued_syncs: dict[tuple[str, Optional[str]], Future] = {}
+        self._queued_syncs_guard = threading.Lock()
+        # Worker pool for sync_async(), created on first use
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Argv per (local path, explicit remote path or None), filled by
+        # prepare() and on first use
+        self._commands: dict[tuple[str, Optional[str]], _PathCommands] = {}
+        self._subprocess_args = SUBPROCESS_ARGS
         self._logger = get_logger("dgmt.rclone")
 
+        # rclone output only ever reaches the DEBUG log, so unless it will be
+        # kept, have rclone skip per-file logging and stats entirely. Flags
+        # that set verbosity explicitly are respected as given.
+        if not _VERBOSITY_FLAGS.isdisjoint(self._flag_map):
+            self._log_flags: tuple[str, ...] = ()
+        elif self._logger.isEnabledFor(logging.DEBUG):
+            self._log_flags = ("--verbose",)
+        else:
+            self._log_flags = ("--stats=0", "--log-level=ERROR")
+
+        # Long-lived `rclone rcd`, started on first use, so each operation is
+        # an HTTP call instead of a fresh rclone process (config parse, auth,
+        # backend setup). Transfer tuning becomes daemon-wide flags; falls
+        # back to the CLI if it can't be started.
+        self._use_rcd = use_rcd
+        self._custom_flags = [f for f in self._flag_map if f not in _VERBOSITY_FLAGS]
+        self._rcd: Optional[RcloneRcd] = None
+        self._rcd_guard = threading.Lock()
+
+        # Last is_healthy() answer as (monotonic time, healthy); reused for
+        # health_ttl seconds and dropped whenever an operation fails
+        self._health_ttl = health_ttl
+        self._health_cache: Optional[tuple[float, bool]] = None
+
+        # Tree fingerprint of each local path at its last successful push
+        self._last_summary: dict[str, tuple[int, int, int]] = {}
+
+        # Whether bisync can recover from interrupted runs by itself
+        # (--resilient/--recover); checked once, on first use
+        self._bisync_recover: Optional[bool] = None
+
     @property
     def name(self) -> str:
         return "rclone"
 
-    def _get_subprocess_args(self) -> dict:
-        """Get platform-specific subprocess arguments."""
-        if sys.platform == "win32":
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = 0
-            return {
-                "startupinfo": startupinfo,
-                "creationflags": subprocess.CREATE_NO_WINDOW,
-            }
-        return {}
+    def _get_rcd(self) -> Optional[RcloneRcd]:
+        """Get the running rc daemon, starting it if enabled."""
+        if not self._use_rcd:
+            return None
+        with self._rcd_guard:
+            if self._rcd is None:
+                self._rcd = RcloneRcd(
+                    rclone_exe=self._rclone_exe, extra_flags=self._transfer_flags
+                )
+            if self._rcd.start():
+                return self._rcd
+            self._logger.warning("rclone rcd unavailable, using rclone CLI")
+            self._use_rcd = False
+            return None
+
+    def _via_rcd(self, label: str, call) -> Optional[subprocess.CompletedProcess]:
+        """
+        Run an operation on the rc daemon.
+
+        Returns a CompletedProcess so callers handle rcd and CLI results the
+        same way, or None if the CLI should be used instead.
+        """
+        rcd = self._get_rcd()
+        if rcd is None:
+            return None
+
+        self._logger.info(f"Running via rcd: {label}")
+        try:
+            call(rcd)
+            return subprocess.CompletedProcess(label, 0, "", "")
+        except RcloneRcdError as e:
+            if e.status == 404:
+                # rc method not known to this rclone version
+                self._logger.debug(f"rclone rcd lacks this method, using CLI: {e}")
+                return None
+            return subprocess.CompletedProcess(label, 1, "", str(e))
+        except requests.RequestException as e:
+            self._logger.warning(f"rclone rcd request failed, using CLI: {e}")
+            return None
+
+    def close(self) -> None:
+        """Shut down the worker pool and the rc daemon, if started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        with self._rcd_guard:
+            self._use_rcd = False
+            if self._rcd is not None:
+                self._rcd.close()
+                self._rcd = None
+
+    def _lock_for(self, local_path: str) -> threading.Lock:
+        """Get (creating if needed) the lock guarding a local path."""
+        with self._path_locks_guard:
+            lock = self._path_locks.get(local_path)
+            if lock is None:
+                lock = self._path_locks[local_path] = threading.Lock()
+            return lock
+
+    def _supports_bisync_recover(self) -> bool:
+        """Check (once) whether this rclone's bisync has --resilient/--recover."""
+        if self._bisync_recover is None:
+            version = _rclone_version(self._rclone_exe)
+            self._bisync_recover = (
+                version is not None and version >= _BISYNC_RECOVER_VERSION
+            )
+        return self._bisync_recover
+
+    def _build_commands(self, local_path: str, remote_path: str) -> _PathCommands:
+        """Build the argv for every operation on a local/remote pair."""
+        bisync_flags: FlagMap = {}
+        if self._supports_bisync_recover():
+            # Let bisync retry after transient errors and recover from an
+            # interrupted run itself, instead of dgmt re-running a full
+            # --resync in a second process
+            bisync_flags["--resilient"] = None
+            bisync_flags["--recover"] = None
+        bisync_flags.update({
+            **self._flag_map,
+            # Ignore checksum to handle files that change during transfer
+            # (e.g., Obsidian's workspace.json)
+            "--ignore-checksum": None,
+            # Conflict resolution: newer modification time wins, no backups
+            "--conflict-resolve": "newer",
+            "--conflict-loser": "delete",
+        })
+        bisync = (
+            self._rclone_exe, "bisync", local_path, remote_path,
+            *_render_flags(bisync_flags),
+            *self._log_flags,
+            *self._transfer_flags,
+        )
+
+        # Use copy with --update so newer files overwrite older ones
+        copy_flags = ("--update", *self._log_flags, *self._transfer_flags)
+        return _PathCommands(
+            remote_path=remote_path,
+            bisync_argv=bisync,
+            bisync_resync_argv=(*bisync, "--resync"),
+            pull_argv=(self._rclone_exe, "copy", remote_path, local_path, *copy_flags),
+            push_argv=(self._rclone_exe, "copy", local_path, remote_path, *copy_flags),
+        )
+
+    def _commands_for(
+        self, local_path: str, remote_path: Optional[str] = None
+    ) -> _PathCommands:
+        """Get the prepared commands for a path, building them if needed."""
+        key = (local_path, remote_path or None)
+        commands = self._commands.get(key)
+        if commands is None:
+            commands = self._build_commands(
+                local_path,
+                remote_path or _remote_path_for(self._remote, self._dest, local_path),
+            )
+            self._commands[key] = commands
+        return commands
+
+    def prepare(self, watch_paths: Iterable[Union[str, Path]]) -> None:
+        """
+        Pre-build remote paths and argv for the given watch paths.
+
+        Optional: paths that were not prepared are built on first use.
+        """
+        for path in watch_paths:
+            self._commands_for(str(path))
 
     def _get_remote_path(self, local_path: str) -> str:
         """Get the remote path for a local path."""
-        folder_name = Path(local_path).name
-        return f"{self._remote}:{self._dest}/{folder_name}"
+        return self._commands_for(local_path).remote_path
 
     def is_healthy(self) -> bool:
         """Check if rclone is available and the remote is configured."""
+        cached = self._health_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self._health_ttl:
+            return cached[1]
+
+        healthy = self._check_health()
+        self._health_cache = (now, healthy)
+        return healthy
+
+    def _invalidate_health(self) -> None:
+        """Forget the cached health result (an operation just failed)."""
+        self._health_cache = None
+
+    def _check_health(self) -> bool:
+        """Probe rclone and the remote configuration (uncached)."""
+        if self._rclone_path is None:
+            self._logger.debug("rclone not found on PATH")
+            return False
+
+        rcd = self._get_rcd()
+        if rcd is not None:
+            try:
+                return self._remote in rcd.list_remotes()
+            except (RcloneRcdError, requests.RequestException) as e:
+                self._logger.debug(f"rclone rcd listremotes failed, using CLI: {e}")
+
         try:
-            result = subprocess.run(
-                ["rclone", "listremotes"],
-                capture_output=True,
-                text=True,
+            result = run_streaming(
+                [self._rclone_exe, "listremotes"],
                 timeout=10,
-                **self._get_subprocess_args(),
+                logger=self._logger,
+                **self._subprocess_args,
             )
             if result.returncode != 0:
                 return False
@@ -74,17 +423,22 @@ class RcloneBackend(Backend):
     def ensure_remote_exists(self, local_path: str) -> bool:
         """Create the remote directory if it doesn't exist."""
         remote_path = self._get_remote_path(local_path)
-        cmd = ["rclone", "mkdir", remote_path]
+        cmd = (self._rclone_exe, "mkdir", remote_path, *self._log_flags)
 
         self._logger.info(f"Ensuring remote exists: {remote_path}")
 
         try:
-            result = subprocess.run(
+            result = self._via_rcd(
+                f"mkdir {remote_path}", lambda rcd: rcd.mkdir(remote_path)
+            )
+            if result is not None:
+                return result.returncode == 0
+
+            result = run_streaming(
                 cmd,
-                capture_output=True,
-                text=True,
                 timeout=30,
-                **self._get_subprocess_args(),
+                logger=self._logger,
+                **self._subprocess_args,
             )
             return result.returncode == 0
         except Exception as e:
@@ -93,106 +447,182 @@ class RcloneBackend(Backend):
 
     def _run_bisync(
         self, local_path: str, remote: str, resync: bool = False
-    ) -> subprocess.CompletedProcess:
-        """Run rclone bisync command."""
-        cmd = ["rclone", "bisync", local_path, remote]
-        cmd.extend(self._flags)
-
-        # Ignore checksum to handle files that change during transfer
-        # (e.g., Obsidian's workspace.json)
-        if "--ignore-checksum" not in cmd:
-            cmd.append("--ignore-checksum")
+    ) -> tuple[subprocess.CompletedProcess, set[str]]:
+        """
+        Run rclone bisync command.
 
-        # Conflict resolution: newer modification time wins, no backups
-        cmd.extend([
-            "--conflict-resolve", "newer",
-            "--conflict-loser", "delete",
-        ])
+        Returns the result plus recovery hints found in the output:
+        'resync' (bisync state lost) and/or 'missing' (remote dir missing).
+        Output is scanned line by line as it streams, so the hints survive
+        even when the lines scroll out of the retained tail.
+        """
+        hints: set[str] = set()
+
+        def scan(line: str) -> None:
+            if _RESYNC_RE.search(line):
+                hints.add("resync")
+            elif _MISSING_DIR_RE.search(line):
+                hints.add("missing")
+
+        recover = self._supports_bisync_recover()
+
+        # Custom flags can't be expressed as rc parameters, so honour them
+        # by running the CLI
+        result = None if self._custom_flags else self._via_rcd(
+            f"bisync {local_path} {remote}{' --resync' if resync else ''}",
+            lambda rcd: rcd.sync_bisync(
+                local_path, remote,
+                resync=resync,
+                resilient=recover,
+                recover=recover,
+                conflictResolve="newer",
+                conflictLoser="delete",
+                _config={"IgnoreChecksum": True},
+            ),
+        )
+        if result is not None:
+            scan(result.stderr)
+            return result, hints
 
-        if resync:
-            cmd.append("--resync")
+        commands = self._commands_for(local_path, remote)
+        cmd = commands.bisync_resync_argv if resync else commands.bisync_argv
 
         self._logger.info(f"Running: {' '.join(cmd)}")
 
-        return subprocess.run(
+        result = run_streaming(
             cmd,
-            capture_output=True,
-            text=True,
             timeout=600,  # 10 minute timeout
-            **self._get_subprocess_args(),
+            logger=self._logger,
+            on_line=scan,
+            **self._subprocess_args,
         )
+        return result, hints
 
     def sync(self, local_path: str, remote_path: Optional[str] = None) -> bool:
-        """Run rclone bisync for the given path."""
-        with self._lock:
-            remote = remote_path or self._get_remote_path(local_path)
-
-            # Ensure remote directory exists before bisync
-            if self._first_run:
-                self.ensure_remote_exists(local_path)
-
-            try:
-                # First run needs --resync
-                resync = self._first_run
-                if self._first_run:
-                    self._first_run = False
+        """
+        Run rclone bisync for the given path.
 
-                result = self._run_bisync(local_path, remote, resync=resync)
+        Calls that arrive while a bisync for the same path is already running
+        are coalesced: they all wait for, and share the result of, a single
+        follow-up bisync instead of queueing one full-tree scan each.
+        """
+        key = (local_path, remote_path)
+        with self._queued_syncs_guard:
+            queued = self._queued_syncs.get(key)
+            if queued is None:
+                future = self._queued_syncs[key] = Future()
+        if queued is not None:
+            # A follow-up run is already queued and will cover this call.
+            # Wait outside the guard: that run needs it to start.
+            return queued.result()
+
+        result = False
+        try:
+            with self._lock_for(local_path):
+                # Started: anything arriving from now on needs a fresh run
+                with self._queued_syncs_guard:
+                    self._queued_syncs.pop(key, None)
+                result = self._do_sync(local_path, remote_path)
+        finally:
+            future.set_result(result)
+        return result
+
+    def sync_async(
+        self, local_path: str, remote_path: Optional[str] = None
+    ) -> Future[bool]:
+        """
+        Run sync() on the backend's worker pool.
 
-                if result.returncode == 0:
-                    self._logger.info(f"Sync completed: {local_path}")
-                    return True
+        Different paths sync concurrently (each holds only its own path
+        lock); calls for the same path are serialized and coalesced.
+        """
+        with self._queued_syncs_guard:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="rclone-sync",
+                )
+            executor = self._executor
+        return executor.submit(self.sync, local_path, remote_path)
 
-                # Check if we need to recover with --resync
-                output = result.stderr + result.stdout
-                if "Must run --resync" in output or "cannot find prior" in output:
-                    self._logger.warning(
-                        "Bisync state corrupted, recovering with --resync"
-                    )
-                    result = self._run_bisync(local_path, remote, resync=True)
+    def _do_sync(self, local_path: str, remote_path: Optional[str]) -> bool:
+        """Run bisync (with recovery); caller holds the path lock."""
+        remote = remote_path or self._get_remote_path(local_path)
 
+        try:
+            # First run needs --resync
+            resync = local_path not in self._resynced_paths
+            self._resynced_paths.add(local_path)
+
+            result, hints = self._run_bisync(local_path, remote, resync=resync)
+
+            if result.returncode == 0:
+                self._logger.info(f"Sync completed: {local_path}")
+                return True
+
+            # Remote folder missing: create it and resync once. Done on
+            # failure rather than up front, saving an rclone spawn per run.
+            if "missing" in hints:
+                self._logger.info("Remote directory missing, creating it")
+                if self.ensure_remote_exists(local_path):
+                    result, hints = self._run_bisync(local_path, remote, resync=True)
                     if result.returncode == 0:
-                        self._logger.info(f"Sync recovered and completed: {local_path}")
+                        self._logger.info(f"Sync completed: {local_path}")
                         return True
 
-                self._logger.error(f"Sync failed: {result.stderr}")
-                return False
+            # Bisync state is gone for good. With --recover, rclone handles
+            # interrupted runs itself, so this full --resync is only needed
+            # for hard failures (or on rclone versions without --recover).
+            if "resync" in hints:
+                self._logger.warning(
+                    "Bisync state corrupted, recovering with --resync"
+                )
+                result, _ = self._run_bisync(local_path, remote, resync=True)
 
-            except subprocess.TimeoutExpired:
-                self._logger.error("Sync timed out")
-                return False
-            except Exception as e:
-                self._logger.error(f"Sync error: {e}")
-                return False
+                if result.returncode == 0:
+                    self._logger.info(f"Sync recovered and completed: {local_path}")
+                    return True
+
+            self._invalidate_health()
+            self._logger.error(f"Sync failed: {result.stderr}")
+            return False
+
+        except subprocess.TimeoutExpired:
+            self._logger.error("Sync timed out")
+            return False
+        except Exception as e:
+            self._logger.error(f"Sync error: {e}")
+            return False
 
     def pull(self, local_path: str, timeout: int = 120) -> bool:
         """Pull latest from remote to local (remote wins on conflicts)."""
-        with self._lock:
-            remote_path = self._get_remote_path(local_path)
-
-            # Use copy with --update so newer remote files overwrite local
-            cmd = [
-                "rclone", "copy",
-                remote_path, local_path,
-                "--update",
-                "--verbose",
-            ]
+        with self._lock_for(local_path):
+            commands = self._commands_for(local_path)
+            remote_path = commands.remote_path
+            cmd = commands.pull_argv
 
             self._logger.info(f"Pulling from remote: {' '.join(cmd)}")
 
             try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout,
-                    **self._get_subprocess_args(),
+                result = self._via_rcd(
+                    f"copy {remote_path} {local_path}",
+                    lambda rcd: rcd.sync_copy(
+                        remote_path, local_path, timeout=timeout, _config={"UpdateOlder": True}
+                    ),
                 )
+                if result is None:
+                    result = run_streaming(
+                        cmd,
+                        timeout=timeout,
+                        logger=self._logger,
+                        **self._subprocess_args,
+                    )
 
                 if result.returncode == 0:
                     self._logger.info(f"Pull completed: {remote_path} -> {local_path}")
                     return True
                 else:
+                    self._invalidate_health()
                     self._logger.error(f"Pull failed: {result.stderr}")
                     return False
 
@@ -204,32 +634,45 @@ class RcloneBackend(Backend):
                 return False
 
     def push(self, local_path: str, timeout: int = 120) -> bool:
-        """Push changes from local to remote."""
-        with self._lock:
-            remote_path = self._get_remote_path(local_path)
+        """
+        Push changes from local to remote.
+
+        Skipped without starting rclone when the local tree is unchanged
+        since the last successful push.
+        """
+        with self._lock_for(local_path):
+            commands = self._commands_for(local_path)
+            remote_path = commands.remote_path
+            cmd = commands.push_argv
 
-            cmd = [
-                "rclone", "copy",
-                local_path, remote_path,
-                "--update",
-                "--verbose",
-            ]
+            summary = tree_signature(local_path)
+            if self._last_summary.get(local_path) == summary:
+                self._logger.debug(f"No local changes since last push: {local_path}")
+                return True
 
             self._logger.info(f"Pushing to remote: {' '.join(cmd)}")
 
             try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout,
-                    **self._get_subprocess_args(),
+                result = self._via_rcd(
+                    f"copy {local_path} {remote_path}",
+                    lambda rcd: rcd.sync_copy(
+                        local_path, remote_path, timeout=timeout, _config={"UpdateOlder": True}
+                    ),
                 )
+                if result is None:
+                    result = run_streaming(
+                        cmd,
+                        timeout=timeout,
+                        logger=self._logger,
+                        **self._subprocess_args,
+                    )
 
                 if result.returncode == 0:
+                    self._last_summary[local_path] = summary
                     self._logger.info(f"Push completed: {local_path} -> {remote_path}")
                     return True
                 else:
+                    self._invalidate_health()
                     self._logger.error(f"Push failed: {result.stderr}")
                     return False
 
@@ -251,53 +694,94 @@ class RcloneBackend(Backend):
             old_local_path: The old local file path.
             new_local_path: The new local file path.
         """
-        with self._lock:
-            try:
-                # Calculate relative paths from watch_path
-                watch = Path(watch_path)
-                old_rel = Path(old_local_path).relative_to(watch)
-                new_rel = Path(new_local_path).relative_to(watch)
+        with self._lock_for(watch_path):
+            return self._rename_locked(watch_path, old_local_path, new_local_path, timeout)
+
+    def rename_many(
+        self, watch_path: str, renames: Iterable[tuple[str, str]], timeout: int = 30
+    ) -> dict[str, bool]:
+        """
+        Apply a batch of local renames under one watch path to the remote.
+
+        The path lock is taken once for the whole batch, and on the rc daemon
+        every move is a JSON call on the same keep-alive connection rather
+        than an rclone spawn per file. A pair whose rc call can't be made
+        falls back to `rclone moveto` on its own; the rest stay on rcd.
+
+        Args:
+            watch_path: The watched directory root.
+            renames: (old local path, new local path) pairs, in order.
+
+        Returns:
+            {old local path: success} for every pair.
+        """
+        results: dict[str, bool] = {}
+        with self._lock_for(watch_path):
+            for old_local_path, new_local_path in renames:
+                results[old_local_path] = self._rename_locked(
+                    watch_path, old_local_path, new_local_path, timeout
+                )
+        return results
 
-                # Build remote paths
-                remote_base = self._get_remote_path(watch_path)
-                old_remote = f"{remote_base}/{old_rel.as_posix()}"
-                new_remote = f"{remote_base}/{new_rel.as_posix()}"
+    def _rename_locked(
+        self, watch_path: str, old_local_path: str, new_local_path: str, timeout: int
+    ) -> bool:
+        """Rename one file on the remote; caller holds the path lock."""
+        try:
+            # Calculate relative paths from watch_path
+            root = os.path.normpath(watch_path)
+            old_rel = _relative_posix(old_local_path, root)
+            new_rel = _relative_posix(new_local_path, root)
 
-                cmd = ["rclone", "moveto", old_remote, new_remote, "--verbose"]
+            # Build remote paths
+            remote_base = self._get_remote_path(watch_path)
+            old_remote = f"{remote_base}/{old_rel}"
+            new_remote = f"{remote_base}/{new_rel}"
 
-                self._logger.info(f"Remote rename: {old_remote} -> {new_remote}")
+            cmd = (self._rclone_exe, "moveto", old_remote, new_remote, *self._log_flags)
 
-                result = subprocess.run(
+            self._logger.info(f"Remote rename: {old_remote} -> {new_remote}")
+
+            result = self._via_rcd(
+                f"movefile {old_remote} {new_remote}",
+                lambda rcd: rcd.movefile(
+                    remote_base, old_rel,
+                    remote_base, new_rel,
+                    timeout=timeout,
+                ),
+            )
+            if result is None:
+                result = run_streaming(
                     cmd,
-                    capture_output=True,
-                    text=True,
                     timeout=timeout,
-                    **self._get_subprocess_args(),
+                    logger=self._logger,
+                    **self._subprocess_args,
                 )
 
-                if result.returncode == 0:
+            if result.returncode == 0:
+                return True
+            else:
+                # File might not exist on remote yet, that's OK
+                stderr_lower = result.stderr.lower()
+                if ("not found" in stderr_lower
+                        or "no such" in stderr_lower
+                        or "doesn't exist" in stderr_lower):
+                    self._logger.debug(f"Remote file not found, skip rename: {old_remote}")
                     return True
-                else:
-                    # File might not exist on remote yet, that's OK
-                    stderr_lower = result.stderr.lower()
-                    if ("not found" in stderr_lower
-                            or "no such" in stderr_lower
-                            or "doesn't exist" in stderr_lower):
-                        self._logger.debug(f"Remote file not found, skip rename: {old_remote}")
-                        return True
-                    self._logger.error(f"Remote rename failed: {result.stderr}")
-                    return False
-
-            except ValueError as e:
-                self._logger.error(f"Path calculation error: {e}")
-                return False
-            except subprocess.TimeoutExpired:
-                self._logger.error("Remote rename timed out")
-                return False
-            except Exception as e:
-                self._logger.error(f"Remote rename error: {e}")
+                self._invalidate_health()
+                self._logger.error(f"Remote rename failed: {result.stderr}")
                 return False
 
+        except ValueError as e:
+            self._logger.error(f"Path calculation error: {e}")
+            return False
+        except subprocess.TimeoutExpired:
+            self._logger.error("Remote rename timed out")
+            return False
+        except Exception as e:
+            self._logger.error(f"Remote rename error: {e}")
+            return False
+
     def __repr__(self) -> str:
         return f"RcloneBackend(remote={self._remote!r}, dest={self._dest!r})"
 
@@ -308,7 +792,13 @@ class RcloneBuilder(BackendBuilder):
     def __init__(self, remote: str = "dgmt") -> None:
         self._remote = remote
         self._dest = "Obsidian-Backup"
-        self._flags: list[str] = ["--verbose"]
+        self._flag_map: FlagMap = {}
+        self._transfers: Optional[int] = None
+        self._checkers: Optional[int] = None
+        self._fast_list = False
+        self._drive_chunk_size: Optional[str] = None
+        self._multi_thread_streams: Optional[int] = None
+        self._use_rcd = True
 
     def dest(self, path: str) -> RcloneBuilder:
         """Set the remote destination path."""
@@ -317,13 +807,47 @@ class RcloneBuilder(BackendBuilder):
 
     def flags(self, *flags: str) -> RcloneBuilder:
         """Set rclone flags."""
-        self._flags = list(flags)
+        self._flag_map = _parse_flags(flags)
+        return self
+
+    def flag(self, name: str, value: Optional[str] = None) -> RcloneBuilder:
+        """Set (or override) a single rclone flag."""
+        self._flag_map[name] = value
         return self
 
     def verbose(self) -> RcloneBuilder:
         """Enable verbose output."""
-        if "--verbose" not in self._flags:
-            self._flags.append("--verbose")
+        self._flag_map["--verbose"] = None
+        return self
+
+    def transfers(self, count: int) -> RcloneBuilder:
+        """Set the number of parallel file transfers."""
+        self._transfers = count
+        return self
+
+    def checkers(self, count: int) -> RcloneBuilder:
+        """Set the number of parallel checkers."""
+        self._checkers = count
+        return self
+
+    def fast_list(self, enabled: bool = True) -> RcloneBuilder:
+        """Use recursive listing (fewer API calls, more memory)."""
+        self._fast_list = enabled
+        return self
+
+    def drive_chunk_size(self, size: str) -> RcloneBuilder:
+        """Set the Google Drive upload chunk size (e.g. '128M')."""
+        self._drive_chunk_size = size
+        return self
+
+    def multi_thread_streams(self, count: int) -> RcloneBuilder:
+        """Set the number of parallel streams used for large files."""
+        self._multi_thread_streams = count
+        return self
+
+    def use_rcd(self, enabled: bool = True) -> RcloneBuilder:
+        """Run operations through a long-lived `rclone rcd` daemon."""
+        self._use_rcd = enabled
         return self
 
     def build(self) -> RcloneBackend:
@@ -331,7 +855,13 @@ class RcloneBuilder(BackendBuilder):
         return RcloneBackend(
             remote=self._remote,
             dest=self._dest,
-            flags=self._flags,
+            flags=self._flag_map,
+            transfers=self._transfers,
+            checkers=self._checkers,
+            fast_list=self._fast_list,
+            drive_chunk_size=self._drive_chunk_size,
+            multi_thread_streams=self._multi_thread_streams,
+            use_rcd=self._use_rcd,
         )
 
 
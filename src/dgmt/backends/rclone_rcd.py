@@ -0,0 +1,265 @@
+"""Client for a long-lived rclone remote-control daemon (``rclone rcd``)."""
+
+from __future__ import annotations
+
+import atexit
+import os
+import secrets
+import socket
+import subprocess
+import threading
+import time
+from typing import Any, Optional
+
+import requests
+
+from dgmt.utils.http import get_session
+from dgmt.utils.logging import get_logger
+from dgmt.utils.proc import SUBPROCESS_ARGS
+
+
+class RcloneRcdError(RuntimeError):
+    """Raised when an rc call or job fails."""
+
+    def __init__(self, message: str, status: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class RcloneRcd:
+    """
+    Runs one ``rclone rcd`` process and talks to it over its HTTP rc API.
+
+    Spawning rclone per operation pays process start-up, config parsing and
+    remote authentication every time. The rc daemon pays those once; each
+    sync afterwards is a JSON POST over a keep-alive connection.
+
+    Example:
+        rcd = RcloneRcd(extra_flags=["--transfers", "16"])
+        if rcd.start():
+            rcd.run_job("sync/copy", {"srcFs": "gdrive:Notes", "dstFs": "/home/me/Notes"})
+        rcd.close()
+    """
+
+    def __init__(
+        self,
+        rclone_exe: str = "rclone",
+        extra_flags: Optional[list[str]] = None,
+        startup_timeout: float = 15.0,
+    ) -> None:
+        """
+        Initialize the client (does not start the daemon).
+
+        Args:
+            rclone_exe: rclone executable to launch.
+            extra_flags: Global rclone flags applied to every job (e.g. --transfers).
+            startup_timeout: Seconds to wait for the daemon to answer.
+        """
+        self._rclone_exe = rclone_exe
+        self._extra_flags = list(extra_flags or [])
+        self._startup_timeout = startup_timeout
+        self._proc: Optional[subprocess.Popen] = None
+        self._base_url = ""
+        self._auth: Optional[tuple[str, str]] = None
+        self._lock = threading.Lock()
+        self._subprocess_args = SUBPROCESS_ARGS
+        self._logger = get_logger("dgmt.rclone.rcd")
+        self._session = get_session()
+        # Registered once; close() is a no-op when the daemon isn't running
+        atexit.register(self.close)
+
+    @staticmethod
+    def _free_port() -> int:
+        """Ask the OS for an unused localhost port."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("127.0.0.1", 0))
+            return sock.getsockname()[1]
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the daemon process is alive."""
+        return self._proc is not None and self._proc.poll() is None
+
+    def start(self) -> bool:
+        """
+        Launch the daemon if it is not already running.
+
+        Returns:
+            True if the daemon is up and answering rc calls.
+        """
+        with self._lock:
+            if self.is_running:
+                return True
+
+            port = self._free_port()
+            user = "dgmt"
+            password = secrets.token_urlsafe(24)
+            cmd = [
+                self._rclone_exe, "rcd",
+                f"--rc-addr=127.0.0.1:{port}",
+                *self._extra_flags,
+            ]
+            # Credentials go through the environment: the command line is
+            # readable by every local user (ps, /proc/<pid>/cmdline)
+            env = {**os.environ, "RCLONE_RC_USER": user, "RCLONE_RC_PASS": password}
+
+            try:
+                self._proc = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    env=env,
+                    **self._subprocess_args,
+                )
+            except (OSError, subprocess.SubprocessError) as e:
+                self._logger.warning(f"Could not start rclone rcd: {e}")
+                self._proc = None
+                return False
+
+            self._base_url = f"http://127.0.0.1:{port}"
+            self._auth = (user, password)
+
+            deadline = time.monotonic() + self._startup_timeout
+            while time.monotonic() < deadline:
+                if self._proc.poll() is not None:
+                    break
+                try:
+                    self.call("rc/noop", timeout=2)
+                    self._logger.info(f"rclone rcd listening on 127.0.0.1:{port}")
+                    return True
+                except (requests.RequestException, RcloneRcdError):
+                    time.sleep(0.1)
+
+            self._logger.warning("rclone rcd did not become ready, falling back to CLI")
+            self._terminate()
+            return False
+
+    def call(
+        self, method: str, params: Optional[dict[str, Any]] = None, timeout: float = 30
+    ) -> dict[str, Any]:
+        """
+        Make a synchronous rc call.
+
+        Args:
+            method: rc method path (e.g. 'operations/mkdir').
+            params: JSON parameters.
+            timeout: HTTP timeout in seconds.
+
+        Returns:
+            Decoded JSON response.
+
+        Raises:
+            RcloneRcdError: If rclone reports an error.
+            requests.RequestException: On transport failures.
+        """
+        resp = self._session.post(
+            f"{self._base_url}/{method}",
+            json=params or {},
+            auth=self._auth,
+            timeout=timeout,
+        )
+        try:
+            body = resp.json()
+        except ValueError:
+            body = {}
+        if resp.status_code != 200:
+            raise RcloneRcdError(
+                body.get("error") or f"HTTP {resp.status_code}", resp.status_code
+            )
+        return body
+
+    def run_job(
+        self, method: str, params: dict[str, Any], timeout: float = 600
+    ) -> dict[str, Any]:
+        """
+        Run an rc method as an async job and wait for it to finish.
+
+        Args:
+            method: rc method path (e.g. 'sync/bisync').
+            params: JSON parameters.
+            timeout: Seconds to wait before stopping the job.
+
+        Returns:
+            The job's output.
+
+        Raises:
+            RcloneRcdError: If the job fails.
+            subprocess.TimeoutExpired: If the job does not finish in time.
+        """
+        job = self.call(method, {**params, "_async": True})
+        job_id = job["jobid"]
+
+        deadline = time.monotonic() + timeout
+        delay = 0.1
+        while True:
+            status = self.call("job/status", {"jobid": job_id})
+            if status.get("finished"):
+                if not status.get("success"):
+                    raise RcloneRcdError(status.get("error") or "job failed")
+                return status.get("output") or {}
+
+            if time.monotonic() >= deadline:
+                try:
+                    self.call("job/stop", {"jobid": job_id})
+                except (requests.RequestException, RcloneRcdError):
+                    pass
+                raise subprocess.TimeoutExpired(method, timeout)
+
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+
+    def sync_bisync(
+        self, path1: str, path2: str, timeout: float = 600, **options: Any
+    ) -> dict[str, Any]:
+        """Run a bisync job between two paths."""
+        return self.run_job("sync/bisync", {"path1": path1, "path2": path2, **options}, timeout)
+
+    def sync_copy(
+        self, src: str, dst: str, timeout: float = 600, **options: Any
+    ) -> dict[str, Any]:
+        """Run a copy job from src to dst."""
+        return self.run_job("sync/copy", {"srcFs": src, "dstFs": dst, **options}, timeout)
+
+    def mkdir(self, fs: str, timeout: float = 30) -> dict[str, Any]:
+        """Create a directory (the root of fs)."""
+        return self.call("operations/mkdir", {"fs": fs, "remote": ""}, timeout=timeout)
+
+    def movefile(
+        self, src_fs: str, src_remote: str, dst_fs: str, dst_remote: str, timeout: float = 30
+    ) -> dict[str, Any]:
+        """Move (rename) a single file."""
+        return self.call(
+            "operations/movefile",
+            {
+                "srcFs": src_fs,
+                "srcRemote": src_remote,
+                "dstFs": dst_fs,
+                "dstRemote": dst_remote,
+            },
+            timeout=timeout,
+        )
+
+    def list_remotes(self, timeout: float = 10) -> list[str]:
+        """List configured remote names (without the trailing colon)."""
+        return self.call("config/listremotes", timeout=timeout).get("remotes") or []
+
+    def _terminate(self) -> None:
+        """Stop the daemon process."""
+        proc, self._proc = self._proc, None
+        if proc is None or proc.poll() is not None:
+            return
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+    def close(self) -> None:
+        """Shut down the daemon."""
+        with self._lock:
+            self._terminate()
+
+    def __repr__(self) -> str:
+        state = "running" if self.is_running else "stopped"
+        return f"RcloneRcd({self._base_url or 'unstarted'!r}, {state})"
@@ -2,11 +2,27 @@
 
 from __future__ import annotations
 
+import functools
+import importlib
+import threading
+from collections.abc import Hashable, Mapping
 from typing import Any, Callable, Optional, Type
 
 from dgmt.backends.base import Backend
 
 
+def _freeze(value: Any) -> Hashable:
+    """Turn constructor kwargs into a hashable cache key."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    hash(value)  # raises TypeError for anything else unhashable
+    return value
+
+
 class BackendRegistry:
     """
     Registry for sync backends.
@@ -17,15 +33,48 @@ class BackendRegistry:
     _backends: dict[str, Type[Backend]] = {}
     _factories: dict[str, Callable[..., Backend]] = {}
 
+    # Name -> constructor with factories shadowing classes, plus the sorted
+    # names; rebuilt on registration so lookups are a single dict access
+    _merged: dict[str, Callable[..., Backend]] = {}
+    _sorted_names: tuple[str, ...] = ()
+
+    # Backends whose instances are shared: get() with the same kwargs
+    # returns the same object (and its daemon/connection pool)
+    _shared: set[str] = set()
+    _instances: dict[tuple[str, Hashable], Backend] = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def _rebuild(cls) -> None:
+        """Recompute the merged lookup table and sorted name list."""
+        cls._merged = {**cls._backends, **cls._factories}
+        cls._sorted_names = tuple(sorted(cls._merged))
+
     @classmethod
     def register(cls, name: str, backend_class: Type[Backend]) -> None:
         """Register a backend class by name."""
         cls._backends[name.lower()] = backend_class
+        cls._rebuild()
 
     @classmethod
-    def register_factory(cls, name: str, factory: Callable[..., Backend]) -> None:
-        """Register a factory function for creating backends."""
-        cls._factories[name.lower()] = factory
+    def register_factory(
+        cls, name: str, factory: Callable[..., Backend], shared: bool = False
+    ) -> None:
+        """
+        Register a factory function for creating backends.
+
+        Args:
+            name: Backend name.
+            factory: Callable returning a backend instance.
+            shared: Reuse one instance per distinct set of kwargs.
+        """
+        name = name.lower()
+        cls._factories[name] = factory
+        if shared:
+            cls._shared.add(name)
+        else:
+            cls._shared.discard(name)
+        cls._rebuild()
 
     @classmethod
     def get(cls, name: str, **kwargs: Any) -> Backend:
@@ -43,45 +92,90 @@ class BackendRegistry:
             ValueError: If backend name is not registered.
         """
         name = name.lower()
+        try:
+            constructor = cls._merged[name]
+        except KeyError:
+            raise ValueError(
+                f"Unknown backend: {name}. "
+                f"Available: {', '.join(cls._sorted_names)}"
+            ) from None
+
+        if name not in cls._shared:
+            return constructor(**kwargs)
+
+        try:
+            key = (name, _freeze(kwargs))
+        except TypeError:
+            # Unhashable option values: can't be matched, so don't share
+            return constructor(**kwargs)
+
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = cls._instances[key] = constructor(**kwargs)
+            return instance
 
-        if name in cls._factories:
-            return cls._factories[name](**kwargs)
-
-        if name in cls._backends:
-            return cls._backends[name](**kwargs)
+    @classmethod
+    def discard(cls, backend: Backend) -> None:
+        """Stop sharing a backend instance (e.g. after closing it)."""
+        with cls._instances_lock:
+            for key, instance in list(cls._instances.items()):
+                if instance is backend:
+                    del cls._instances[key]
 
-        raise ValueError(
-            f"Unknown backend: {name}. "
-            f"Available: {', '.join(cls.list_backends())}"
-        )
+    @classmethod
+    def clear_instances(cls) -> None:
+        """Forget all shared backend instances."""
+        with cls._instances_lock:
+            cls._instances.clear()
 
     @classmethod
     def list_backends(cls) -> list[str]:
         """List all registered backend names."""
-        names = set(cls._backends.keys()) | set(cls._factories.keys())
-        return sorted(names)
+        return list(cls._sorted_names)
 
     @classmethod
     def has(cls, name: str) -> bool:
         """Check if a backend is registered."""
-        name = name.lower()
-        return name in cls._backends or name in cls._factories
+        return name.lower() in cls._merged
+
+
+@functools.lru_cache(maxsize=None)
+def _load(module: str, attr: str) -> Callable[..., Backend]:
+    """Import a backend module on first use and return one of its factories."""
+    return getattr(importlib.import_module(module), attr)
+
+
+def _lazy_factory(module: str, attr: str) -> Callable[..., Backend]:
+    """Make a factory that defers importing its backend module until called."""
+    def factory(**kwargs: Any) -> Backend:
+        return _load(module, attr)(**kwargs)
+
+    factory.__name__ = attr
+    factory.__qualname__ = attr
+    return factory
 
 
 def _register_default_backends() -> None:
-    """Register the built-in backends."""
-    from dgmt.backends.sftp import SftpBackend, sftp
-    from dgmt.backends.syncthing import SyncthingBackend, syncthing
-    from dgmt.backends.rclone import RcloneBackend, rclone
-
-    BackendRegistry.register("sftp", SftpBackend)
-    BackendRegistry.register("syncthing", SyncthingBackend)
-    BackendRegistry.register("rclone", RcloneBackend)
-
-    # Register convenience factories
-    BackendRegistry.register_factory("sftp", sftp)
-    BackendRegistry.register_factory("syncthing", syncthing)
-    BackendRegistry.register_factory("rclone", rclone)
+    """
+    Register the built-in backends.
+
+    Registered as thunks so importing the registry doesn't import every
+    backend (and paramiko/requests with them); a backend module is only
+    loaded the first time that backend is requested.
+    """
+    # Each backend is shared per distinct set of options: one rclone rc
+    # daemon, one SSH master/pooled transport per host, and one Syncthing
+    # client (API key read once) serve every caller with the same settings
+    BackendRegistry.register_factory(
+        "sftp", _lazy_factory("dgmt.backends.sftp", "sftp"), shared=True
+    )
+    BackendRegistry.register_factory(
+        "syncthing", _lazy_factory("dgmt.backends.syncthing", "syncthing"), shared=True
+    )
+    BackendRegistry.register_factory(
+        "rclone", _lazy_factory("dgmt.backends.rclone", "rclone"), shared=True
+    )
 
 
 # Auto-register defaults on import
@@ -2,14 +2,170 @@
 
 from __future__ import annotations
 
+import functools
+import heapq
+import ipaddress
+import logging
+import os
+import re
+import shlex
+import socket
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Union
 
 from dgmt.backends.base import Backend, BackendBuilder
 from dgmt.utils.logging import get_logger
-from dgmt.utils.paths import expand_path
+from dgmt.utils.paths import expand_path, get_config_dir
+from dgmt.utils.proc import SUBPROCESS_ARGS, run_streaming
+
+# How long an idle SSH master connection is kept open
+CONTROL_PERSIST = "60s"
+
+# rsync compression per `compress` setting ('auto' is decided per host)
+_COMPRESS_ARGS: dict[str, tuple[str, ...]] = {
+    "none": (),
+    "zlib": ("-z",),
+    "zstd": ("-z", "--compress-choice=zstd", "--compress-level=1"),
+}
+
+# Below this mean file size, rsync's delta algorithm costs more than it saves
+SMALL_FILE_THRESHOLD = 64 * 1024
+
+# Output lines kept per stream from each rsync run (for error messages)
+RSYNC_TAIL_LINES = 200
+
+# Seconds a successful ensure_remote_path() is trusted before re-running
+REMOTE_PATH_TTL = 3600
+
+# In-process SSH clients for health checks, keyed by every connection
+# argument so backends pointing at the same server share one transport
+_CLIENT_POOL: dict[tuple[str, Optional[str], int, Optional[str]], Any] = {}
+# Monotonic time paramiko last failed to connect, per pool key. Hosts it
+# can't handle (ProxyJump, certificates, ...) go straight to the ssh CLI
+# instead of repeating a failing connect on every health check.
+_PARAMIKO_FAILED: dict[tuple[str, Optional[str], int, Optional[str]], float] = {}
+_CLIENT_POOL_LOCK = threading.Lock()
+
+# Seconds after a failed paramiko connect before it is tried again
+PARAMIKO_RETRY_SECONDS = 600
+
+
+# `rsync --version` output, e.g. "rsync  version 3.2.7  protocol version 31"
+_RSYNC_VERSION_RE = re.compile(r"^rsync\s+version\s+v?(\d+)\.(\d+)", re.MULTILINE)
+
+# First rsync release with --info (fine-grained output control)
+_RSYNC_INFO_VERSION = (3, 1)
+
+
+@functools.lru_cache(maxsize=None)
+def _rsync_version() -> Optional[tuple[int, int]]:
+    """Get the local rsync's (major, minor) version, or None if unknown."""
+    try:
+        result = subprocess.run(
+            ["rsync", "--version"],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=10,
+            **SUBPROCESS_ARGS,
+        )
+    except (subprocess.SubprocessError, OSError):
+        return None
+    # openrsync (stock on recent macOS) claims 2.6.9 compatibility but
+    # supports neither --info nor --stats
+    if "openrsync" in result.stdout:
+        return None
+    match = _RSYNC_VERSION_RE.search(result.stdout)
+    if match is None:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def _rsync_summary_args() -> tuple[str, ...]:
+    """Flags for a short end-of-transfer summary the local rsync accepts."""
+    version = _rsync_version()
+    if version is None:
+        # openrsync or unrecognised output: no summary rather than a bad flag
+        return ()
+    if version >= _RSYNC_INFO_VERSION:
+        return ("--info=stats1",)
+    # Stock macOS rsync 2.6.9
+    return ("--stats",)
+
+
+def _local_dir(local_path: str) -> str:
+    """
+    Expand a local folder to an absolute path ending in '/' (for rsync).
+
+    Not cached: expansion resolves symlinks, which can be re-pointed while
+    the daemon runs.
+    """
+    local_dir = str(expand_path(local_path))
+    return local_dir if local_dir.endswith("/") else local_dir + "/"
+
+
+def _tree_size(path: str) -> int:
+    """Total size of the files under a directory."""
+    return _tree_stats(path)[1]
+
+
+def _tree_stats(path: str) -> tuple[int, int]:
+    """File count and total size of the files under a directory."""
+    count = 0
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            total += entry.stat(follow_symlinks=False).st_size
+                            count += 1
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return count, total
+
+
+def _bucket_entries(local_path: str, count: int) -> list[list[str]]:
+    """
+    Split the top-level entries of a directory into size-balanced groups.
+
+    Largest entries are placed first, each into the currently lightest
+    group (LPT scheduling). Empty groups are dropped.
+    """
+    sized: list[tuple[int, str]] = []
+    try:
+        with os.scandir(local_path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        size = _tree_size(entry.path)
+                    else:
+                        size = entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+                sized.append((size, entry.name))
+    except OSError:
+        return []
+
+    heap = [(0, i) for i in range(count)]
+    groups: list[list[str]] = [[] for _ in range(count)]
+    for size, name in sorted(sized, reverse=True):
+        load, i = heapq.heappop(heap)
+        groups[i].append(name)
+        heapq.heappush(heap, (load + size, i))
+    return [group for group in groups if group]
 
 
 class SftpBackend(Backend):
@@ -28,6 +184,10 @@ class SftpBackend(Backend):
         user: Optional[str] = None,
         port: int = 22,
         bidirectional: bool = True,
+        multiplex: bool = True,
+        concurrency: int = 1,
+        compress: str = "auto",
+        small_files: Union[bool, str] = "auto",
     ) -> None:
         """
         Initialize SFTP backend.
@@ -39,21 +199,73 @@ class SftpBackend(Backend):
             user: SSH username (optional, uses config default).
             port: SSH port (default 22).
             bidirectional: If True, sync both directions.
+            multiplex: Share one SSH connection between commands
+                (OpenSSH ControlMaster; not available on Windows).
+            concurrency: Number of parallel rsync processes used by push.
+            compress: rsync compression: 'none', 'zlib', 'zstd' (rsync 3.2+
+                on both ends), or 'auto' to skip it for hosts on a private
+                or loopback network and use fast zlib otherwise.
+            small_files: Send whole files (-W) instead of rsync deltas:
+                True, False, or 'auto' to decide per folder from its mean
+                file size.
         """
+        if compress != "auto" and compress not in _COMPRESS_ARGS:
+            raise ValueError(f"Unknown compression: {compress}")
         self._host = host
         self._remote_path = remote_path
         self._ssh_key = expand_path(ssh_key) if ssh_key else None
         self._user = user
         self._port = port
         self._bidirectional = bidirectional
+        self._concurrency = max(1, concurrency)
+        self._compress = compress
+        self._compress_args: Optional[tuple[str, ...]] = None
+        self._small_files = small_files
+        # Per-folder 'auto' decision for -W, made on first transfer
+        self._whole_file: dict[str, bool] = {}
+        self._ssh_target = f"{user}@{host}" if user else host
         self._logger = get_logger("dgmt.sftp")
 
+        # With multiplexing, the first ssh becomes a background master and
+        # every later ssh/rsync joins its socket, skipping key exchange and
+        # auth. %C is a hash of host, port and user, one socket per target.
+        self._multiplex = multiplex and sys.platform != "win32"
+        self._control_path = str(get_config_dir() / "cm-%C") if self._multiplex else None
+        self._master_started = False
+        self._master_lock = threading.Lock()
+
+        # Connection settings are fixed after construction, so the pieces
+        # of every rsync command are built once here
+        self._subprocess_args = SUBPROCESS_ARGS
+        self._remote_uri = self._get_remote_uri()
+        self._remote_uri_dir = self._remote_uri.rstrip("/") + "/"
+        # Per-file listing (-v) only when it will actually be logged;
+        # otherwise just a short transfer summary
+        if self._logger.isEnabledFor(logging.DEBUG):
+            verbosity: tuple[str, ...] = ("-v",)
+        else:
+            verbosity = _rsync_summary_args()
+        self._rsync_base = (
+            "rsync",
+            "-a",                # archive
+            *verbosity,
+            "--update",          # skip files newer on destination
+            # Keep interrupted files to resume from, out of the tree
+            "--partial", "--partial-dir=.rsync-partial",
+            "-e", self._get_rsync_ssh_cmd(),
+        )
+
+        # Monotonic time of the last successful ensure_remote_path(); the
+        # remote directory is a constant, so it is only re-checked hourly
+        self._remote_path_ensured: Optional[float] = None
+        self._remote_path_lock = threading.Lock()
+
     @property
     def name(self) -> str:
         return "sftp"
 
-    def _get_rsync_ssh_cmd(self) -> str:
-        """Build the SSH command string for rsync."""
+    def _get_ssh_cmd(self) -> list[str]:
+        """Build the base SSH command (connection and multiplexing options)."""
         cmd_parts = ["ssh"]
 
         if self._port != 22:
@@ -62,7 +274,121 @@ class SftpBackend(Backend):
         if self._ssh_key:
             cmd_parts.extend(["-i", str(self._ssh_key)])
 
-        return " ".join(cmd_parts)
+        if self._control_path:
+            cmd_parts.extend([
+                "-o", "ControlMaster=auto",
+                "-o", f"ControlPath={self._control_path}",
+                "-o", f"ControlPersist={CONTROL_PERSIST}",
+            ])
+
+        return cmd_parts
+
+    def _get_rsync_ssh_cmd(self) -> str:
+        """Build the SSH command string for rsync."""
+        return shlex.join(self._get_ssh_cmd())
+
+    def _get_compress_args(self) -> tuple[str, ...]:
+        """
+        Get the rsync compression flags, deciding 'auto' once.
+
+        zlib at its default level tops out around 50 MB/s on one core, so
+        on a LAN (or a VPN with private addresses) compressing is slower
+        than sending. Elsewhere, level 1 keeps most of the saving for a
+        fraction of the CPU.
+        """
+        if self._compress_args is not None:
+            return self._compress_args
+
+        if self._compress != "auto":
+            self._compress_args = _COMPRESS_ARGS[self._compress]
+            return self._compress_args
+
+        compress_args: tuple[str, ...] = ("-z", "--compress-level=1")
+        try:
+            infos = socket.getaddrinfo(self._host, self._port, proto=socket.IPPROTO_TCP)
+            addresses = {ipaddress.ip_address(info[4][0].split("%")[0]) for info in infos}
+            if addresses and all(a.is_private or a.is_loopback for a in addresses):
+                compress_args = ()
+        except (OSError, ValueError):
+            # e.g. a ~/.ssh/config alias that only ssh can resolve
+            pass
+
+        self._logger.debug(f"rsync compression for {self._host}: {compress_args or 'off'}")
+        self._compress_args = compress_args
+        return compress_args
+
+    def _get_whole_file_args(self, local_path: str) -> tuple[str, ...]:
+        """
+        Get ('-W',) if files in this folder should be sent whole.
+
+        For trees of small files (e.g. markdown notes) the rolling-checksum
+        pass costs more CPU and round trips than just sending the file.
+        """
+        if self._small_files != "auto":
+            return ("-W",) if self._small_files else ()
+
+        whole_file = self._whole_file.get(local_path)
+        if whole_file is None:
+            count, total = _tree_stats(local_path)
+            whole_file = count > 0 and total / count < SMALL_FILE_THRESHOLD
+            self._whole_file[local_path] = whole_file
+        return ("-W",) if whole_file else ()
+
+    def start_master(self) -> bool:
+        """
+        Open the shared SSH master connection if it isn't already.
+
+        Called before the first command; commands also use
+        ControlMaster=auto, so they still work if this fails.
+
+        Returns:
+            True if a master is running (or multiplexing is disabled).
+        """
+        if not self._control_path:
+            return True
+        with self._master_lock:
+            if self._master_started:
+                return True
+            cmd = [*self._get_ssh_cmd(), "-M", "-N", "-f",
+                   "-o", "BatchMode=yes", "-o", "ConnectTimeout=5", self._ssh_target]
+            try:
+                result = subprocess.run(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    capture_output=True,
+                    text=True,
+                    timeout=15,
+                    **self._subprocess_args,
+                )
+            except (subprocess.SubprocessError, FileNotFoundError) as e:
+                self._logger.debug(f"Could not start SSH master: {e}")
+                return False
+            if result.returncode != 0:
+                self._logger.debug(f"Could not start SSH master: {result.stderr.strip()}")
+                return False
+            self._master_started = True
+            return True
+
+    def close_master(self) -> None:
+        """Shut down the shared SSH master connection, if any."""
+        if not self._control_path:
+            return
+        with self._master_lock:
+            try:
+                subprocess.run(
+                    [*self._get_ssh_cmd(), "-O", "exit", self._ssh_target],
+                    stdin=subprocess.DEVNULL,
+                    capture_output=True,
+                    timeout=5,
+                    **self._subprocess_args,
+                )
+            except (subprocess.SubprocessError, FileNotFoundError):
+                pass
+            self._master_started = False
+
+    def close(self) -> None:
+        """Release the backend's SSH master connection."""
+        self.close_master()
 
     def _get_remote_uri(self) -> str:
         """Build the rsync remote URI."""
@@ -70,29 +396,120 @@ class SftpBackend(Backend):
             return f"{self._user}@{self._host}:{self._remote_path}"
         return f"{self._host}:{self._remote_path}"
 
-    def _get_subprocess_args(self) -> dict:
-        """Get platform-specific subprocess arguments."""
-        if sys.platform == "win32":
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = 0
-            return {
-                "startupinfo": startupinfo,
-                "creationflags": subprocess.CREATE_NO_WINDOW,
-            }
-        return {}
+    def _pool_key(self) -> tuple[str, Optional[str], int, Optional[str]]:
+        """Key identifying this backend's SSH connection in the client pool."""
+        return (
+            self._host,
+            self._user,
+            self._port,
+            str(self._ssh_key) if self._ssh_key else None,
+        )
+
+    def _get_transport(self):
+        """
+        Get a live pooled paramiko transport to the host, connecting if needed.
+
+        Host aliases are resolved through ~/.ssh/config, like the ssh CLI.
+        The pool lock is only held to look up and insert clients, so a slow
+        or unreachable host doesn't stall checks against other hosts.
+
+        Returns:
+            The transport, or None if paramiko failed for this host within
+            the last PARAMIKO_RETRY_SECONDS.
+
+        Raises:
+            ImportError: If paramiko isn't installed.
+            Exception: paramiko/socket errors if the connection fails.
+        """
+        import paramiko
+
+        key = self._pool_key()
+        stale = None
+        with _CLIENT_POOL_LOCK:
+            failed_at = _PARAMIKO_FAILED.get(key)
+            if failed_at is not None and time.monotonic() - failed_at < PARAMIKO_RETRY_SECONDS:
+                return None
+            client = _CLIENT_POOL.get(key)
+            if client is not None:
+                transport = client.get_transport()
+                if transport is not None and transport.is_active():
+                    return transport
+                stale = _CLIENT_POOL.pop(key)
+        if stale is not None:
+            stale.close()
+
+        try:
+            options: dict[str, Any] = {}
+            ssh_config_file = Path("~/.ssh/config").expanduser()
+            if ssh_config_file.exists():
+                options = paramiko.SSHConfig.from_path(str(ssh_config_file)).lookup(self._host)
+
+            key_filename = str(self._ssh_key) if self._ssh_key else options.get("identityfile")
+            client = paramiko.SSHClient()
+            client.load_system_host_keys()
+            # Same as BatchMode: never prompt, never trust unknown hosts
+            client.set_missing_host_key_policy(paramiko.RejectPolicy())
+            client.connect(
+                options.get("hostname", self._host),
+                port=self._port if self._port != 22 else int(options.get("port", 22)),
+                username=self._user or options.get("user"),
+                key_filename=key_filename,
+                timeout=5,
+                banner_timeout=5,
+                auth_timeout=5,
+            )
+        except Exception:
+            with _CLIENT_POOL_LOCK:
+                _PARAMIKO_FAILED[key] = time.monotonic()
+            raise
+
+        with _CLIENT_POOL_LOCK:
+            _PARAMIKO_FAILED.pop(key, None)
+            # Another thread may have connected meanwhile; keep one client
+            pooled = _CLIENT_POOL.get(key)
+            if pooled is not None:
+                transport = pooled.get_transport()
+                if transport is not None and transport.is_active():
+                    client.close()
+                    return transport
+            _CLIENT_POOL[key] = client
+        if pooled is not None:
+            pooled.close()
+        return client.get_transport()
+
+    def _evict_transport(self) -> None:
+        """Drop this backend's pooled client (its connection is dead)."""
+        with _CLIENT_POOL_LOCK:
+            client = _CLIENT_POOL.pop(self._pool_key(), None)
+        if client is not None:
+            client.close()
 
     def is_healthy(self) -> bool:
-        """Check if we can connect to the remote host."""
-        ssh_cmd = ["ssh"]
-        if self._port != 22:
-            ssh_cmd.extend(["-p", str(self._port)])
-        if self._ssh_key:
-            ssh_cmd.extend(["-i", str(self._ssh_key)])
+        """
+        Check if we can connect to the remote host.
 
-        # Build host string
-        host = f"{self._user}@{self._host}" if self._user else self._host
-        ssh_cmd.extend(["-o", "BatchMode=yes", "-o", "ConnectTimeout=5", host, "echo ok"])
+        Uses a pooled in-process SSH transport, so a check is one message
+        on an open connection instead of spawning ssh. Falls back to the ssh
+        CLI (which honours the full ~/.ssh/config) if that can't connect.
+        """
+        try:
+            transport = self._get_transport()
+            if transport is not None:
+                transport.send_ignore()
+                if transport.is_active():
+                    return True
+                self._evict_transport()
+        except ImportError:
+            pass
+        except Exception as e:
+            self._logger.debug(f"In-process SSH check failed, using ssh: {e}")
+            self._evict_transport()
+
+        self.start_master()
+        ssh_cmd = self._get_ssh_cmd()
+        ssh_cmd.extend([
+            "-o", "BatchMode=yes", "-o", "ConnectTimeout=5", self._ssh_target, "echo ok",
+        ])
 
         try:
             result = subprocess.run(
@@ -100,7 +517,7 @@ class SftpBackend(Backend):
                 capture_output=True,
                 text=True,
                 timeout=10,
-                **self._get_subprocess_args(),
+                **self._subprocess_args,
             )
             return result.returncode == 0 and "ok" in result.stdout
         except (subprocess.SubprocessError, FileNotFoundError):
@@ -110,9 +527,20 @@ class SftpBackend(Backend):
         """
         Bidirectional sync using rsync.
 
-        Performs push then pull to achieve bidirectional sync.
+        Performs push and pull to achieve bidirectional sync. When an SSH
+        master connection is up, both rsyncs run at once as two channels on
+        it, instead of one after the other.
         """
         if self._bidirectional:
+            if self._control_path and self.start_master():
+                # --update on both sides keeps the directions from fighting:
+                # each only copies files that are newer on its source
+                with ThreadPoolExecutor(max_workers=1, thread_name_prefix="sftp-push") as pool:
+                    push_future = pool.submit(self.push, local_path)
+                    pull_ok = self.pull(local_path)
+                    push_ok = push_future.result()
+                return push_ok and pull_ok
+
             # Push local changes, then pull remote changes
             push_ok = self.push(local_path)
             pull_ok = self.pull(local_path)
@@ -122,34 +550,25 @@ class SftpBackend(Backend):
 
     def pull(self, local_path: str, timeout: int = 120) -> bool:
         """Pull changes from remote to local."""
-        local_path = str(expand_path(local_path))
-        remote_uri = self._get_remote_uri()
-
-        # Ensure local path ends with / for rsync
-        if not local_path.endswith("/"):
-            local_path += "/"
-
-        # Ensure remote path ends with / for rsync
-        remote_uri_dir = remote_uri if remote_uri.endswith("/") else remote_uri + "/"
-
+        local_path = _local_dir(local_path)
         cmd = [
-            "rsync",
-            "-avz",              # archive, verbose, compress
-            "--update",          # skip files newer on destination
-            "-e", self._get_rsync_ssh_cmd(),
-            remote_uri_dir,
+            *self._rsync_base,
+            *self._get_compress_args(),
+            *self._get_whole_file_args(local_path),
+            self._remote_uri_dir,
             local_path,
         ]
 
-        self._logger.info(f"Pulling: {remote_uri} -> {local_path}")
+        self._logger.info(f"Pulling: {self._remote_uri} -> {local_path}")
+        self.start_master()
 
         try:
-            result = subprocess.run(
+            result = run_streaming(
                 cmd,
-                capture_output=True,
-                text=True,
                 timeout=timeout,
-                **self._get_subprocess_args(),
+                tail_lines=RSYNC_TAIL_LINES,
+                logger=self._logger,
+                **self._subprocess_args,
             )
 
             if result.returncode == 0:
@@ -171,35 +590,33 @@ class SftpBackend(Backend):
 
     def push(self, local_path: str, timeout: int = 120) -> bool:
         """Push changes from local to remote."""
-        local_path = str(expand_path(local_path))
-        remote_uri = self._get_remote_uri()
-
-        # Ensure local path ends with / for rsync
-        if not local_path.endswith("/"):
-            local_path += "/"
-
-        # Ensure remote path ends with / for rsync
-        remote_uri_dir = remote_uri if remote_uri.endswith("/") else remote_uri + "/"
-
+        local_path = _local_dir(local_path)
         cmd = [
-            "rsync",
-            "-avz",              # archive, verbose, compress
-            "--update",          # skip files newer on destination
-            "-e", self._get_rsync_ssh_cmd(),
+            *self._rsync_base,
+            *self._get_compress_args(),
+            *self._get_whole_file_args(local_path),
             local_path,
-            remote_uri_dir,
+            self._remote_uri_dir,
         ]
 
-        self._logger.info(f"Pushing: {local_path} -> {remote_uri}")
+        self._logger.info(f"Pushing: {local_path} -> {self._remote_uri}")
+        self.start_master()
+
+        buckets = (
+            _bucket_entries(local_path, self._concurrency) if self._concurrency > 1 else []
+        )
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                **self._get_subprocess_args(),
-            )
+            if len(buckets) > 1:
+                result = self._run_buckets(cmd, buckets, timeout)
+            else:
+                result = run_streaming(
+                    cmd,
+                    timeout=timeout,
+                    tail_lines=RSYNC_TAIL_LINES,
+                    logger=self._logger,
+                    **self._subprocess_args,
+                )
 
             if result.returncode == 0:
                 self._logger.info("Push completed successfully")
@@ -218,30 +635,91 @@ class SftpBackend(Backend):
             self._logger.error(f"Push error: {e}")
             return False
 
-    def ensure_remote_path(self) -> bool:
-        """Create the remote directory if it doesn't exist."""
-        host = f"{self._user}@{self._host}" if self._user else self._host
-
-        ssh_cmd = ["ssh"]
-        if self._port != 22:
-            ssh_cmd.extend(["-p", str(self._port)])
-        if self._ssh_key:
-            ssh_cmd.extend(["-i", str(self._ssh_key)])
+    def _run_buckets(
+        self, cmd: list[str], buckets: list[list[str]], timeout: int
+    ) -> subprocess.CompletedProcess:
+        """
+        Run one rsync per group of top-level entries, in parallel.
 
-        ssh_cmd.extend([host, f"mkdir -p {self._remote_path}"])
+        Each child gets its entries through --files-from and, when
+        multiplexing, joins the shared SSH master rather than opening its
+        own connection.
 
+        Returns:
+            A combined result: the worst return code and all stderr output.
+        """
+        *options, source, dest = cmd
+        list_files: list[str] = []
         try:
-            result = subprocess.run(
-                ssh_cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                **self._get_subprocess_args(),
-            )
-            return result.returncode == 0
-        except Exception as e:
-            self._logger.error(f"Failed to create remote directory: {e}")
-            return False
+            commands = []
+            for names in buckets:
+                fd, list_file = tempfile.mkstemp(prefix="dgmt-rsync-", suffix=".lst")
+                list_files.append(list_file)
+                with os.fdopen(fd, "wb") as f:
+                    f.write(b"\0".join(os.fsencode(name) for name in names))
+                # --files-from turns off the recursion implied by -a
+                commands.append(
+                    [*options, "-r", "--from0", f"--files-from={list_file}", source, dest]
+                )
+
+            def run(bucket_cmd: list[str]) -> subprocess.CompletedProcess:
+                return run_streaming(
+                    bucket_cmd,
+                    timeout=timeout,
+                    tail_lines=RSYNC_TAIL_LINES,
+                    logger=self._logger,
+                    **self._subprocess_args,
+                )
+
+            with ThreadPoolExecutor(
+                max_workers=len(commands), thread_name_prefix="sftp-rsync"
+            ) as pool:
+                results = list(pool.map(run, commands))
+        finally:
+            for list_file in list_files:
+                try:
+                    os.unlink(list_file)
+                except OSError:
+                    pass
+
+        return subprocess.CompletedProcess(
+            cmd,
+            max(r.returncode for r in results),
+            "\n".join(r.stdout for r in results),
+            "\n".join(r.stderr for r in results),
+        )
+
+    def ensure_remote_path(self) -> bool:
+        """
+        Create the remote directory if it doesn't exist.
+
+        A success is remembered for REMOTE_PATH_TTL seconds, during which
+        this returns True without contacting the server.
+        """
+        with self._remote_path_lock:
+            ensured = self._remote_path_ensured
+            if ensured is not None and time.monotonic() - ensured < REMOTE_PATH_TTL:
+                return True
+
+            self.start_master()
+            ssh_cmd = self._get_ssh_cmd()
+            ssh_cmd.extend([self._ssh_target, f"mkdir -p {self._remote_path}"])
+
+            try:
+                result = subprocess.run(
+                    ssh_cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                    **self._subprocess_args,
+                )
+                if result.returncode != 0:
+                    return False
+                self._remote_path_ensured = time.monotonic()
+                return True
+            except Exception as e:
+                self._logger.error(f"Failed to create remote directory: {e}")
+                return False
 
     def __repr__(self) -> str:
         return f"SftpBackend(host={self._host!r}, remote_path={self._remote_path!r})"
@@ -268,6 +746,10 @@ class SftpBuilder(BackendBuilder):
         self._user: Optional[str] = None
         self._port = 22
         self._bidirectional = True
+        self._multiplex = True
+        self._concurrency = 1
+        self._compress = "auto"
+        self._small_files: Union[bool, str] = "auto"
 
     def remote_path(self, path: str) -> SftpBuilder:
         """Set the remote sync path."""
@@ -299,6 +781,26 @@ class SftpBuilder(BackendBuilder):
         self._bidirectional = False
         return self
 
+    def multiplex(self, enabled: bool = True) -> SftpBuilder:
+        """Enable/disable SSH connection sharing (ControlMaster)."""
+        self._multiplex = enabled
+        return self
+
+    def concurrency(self, count: int) -> SftpBuilder:
+        """Set the number of parallel rsync processes used by push."""
+        self._concurrency = count
+        return self
+
+    def compress(self, mode: str) -> SftpBuilder:
+        """Set rsync compression: 'auto', 'none', 'zlib' or 'zstd'."""
+        self._compress = mode
+        return self
+
+    def tuning(self, small_files: Union[bool, str] = "auto") -> SftpBuilder:
+        """Set whether to send whole files (-W): True, False or 'auto'."""
+        self._small_files = small_files
+        return self
+
     def build(self) -> SftpBackend:
         """Build the SftpBackend instance."""
         return SftpBackend(
@@ -308,6 +810,10 @@ class SftpBuilder(BackendBuilder):
             user=self._user,
             port=self._port,
             bidirectional=self._bidirectional,
+            multiplex=self._multiplex,
+            concurrency=self._concurrency,
+            compress=self._compress,
+            small_files=self._small_files,
         )
 
 
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import io
+import re
 import subprocess
 import sys
 import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 import os
@@ -13,8 +16,20 @@ import os
 import requests
 
 from dgmt.backends.base import Backend, BackendBuilder
+from dgmt.utils.http import get_session
 from dgmt.utils.logging import get_logger
-from dgmt.utils.paths import expand_path
+from dgmt.utils.paths import expand_path, tree_signature
+from dgmt.utils.proc import SUBPROCESS_ARGS
+
+# Matches the GUI API key in Syncthing's config.xml without building a DOM.
+_APIKEY_RE = re.compile(rb"<apikey[^>]*>([^<]+)</apikey>")
+
+# Seconds the folder path -> ID map is reused before re-fetching it
+FOLDER_CACHE_TTL = 30
+
+# API keys already read, as {config path: (mtime_ns, key)}; re-read only
+# when config.xml changes
+_API_KEY_CACHE: dict[str, tuple[int, Optional[str]]] = {}
 
 
 class SyncthingBackend(Backend):
@@ -31,10 +46,37 @@ class SyncthingBackend(Backend):
         api_key: Optional[str] = None,
         exe_path: Optional[str] = None,
     ) -> None:
+        self._logger = get_logger("dgmt.syncthing")
         self._api_url = api_url
         self._api_key = api_key or self._read_api_key()
         self._exe_path = exe_path
-        self._logger = get_logger("dgmt.syncthing")
+
+        # Hidden-window args for taskkill, shared process-wide
+        self._subprocess_args = SUBPROCESS_ARGS
+        # Syncthing process started directly by start(), if any
+        self._child: Optional[subprocess.Popen] = None
+
+        # Keep-alive session so periodic health probes reuse one socket
+        # instead of opening a fresh TCP connection every poll. The session
+        # is shared process-wide, so the API key travels as a prebuilt
+        # per-request header dict rather than a session default.
+        self._session = get_session()
+        self._headers: dict[str, str] = {"X-API-Key": self._api_key} if self._api_key else {}
+        self._ping_url = f"{self._api_url}/rest/system/ping"
+
+        # Whether /rest/db/completion answers for the local device (None
+        # until first tried), and the device ID it is queried with
+        self._completion_supported: Optional[bool] = None
+        self._device_id: Optional[str] = None
+
+        # ID of the last Syncthing event seen, for /rest/events long-polls
+        self._last_event_id = 0
+
+        # Local tree signature at each folder's last successful rescan
+        self._last_scan_signature: dict[str, tuple[int, int, int]] = {}
+
+        # (monotonic fetch time, {resolved folder path: folder ID})
+        self._folder_cache: Optional[tuple[float, dict[str, str]]] = None
 
     @property
     def name(self) -> str:
@@ -47,35 +89,53 @@ class SyncthingBackend(Backend):
         else:
             config_path = Path("~/.config/syncthing/config.xml").expanduser()
 
-        if config_path.exists():
-            try:
-                tree = ET.parse(config_path)
-                gui = tree.find(".//gui")
-                if gui is not None:
-                    apikey = gui.find("apikey")
-                    if apikey is not None:
-                        return apikey.text
-            except Exception as e:
-                self._logger.warning(f"Could not read Syncthing API key: {e}")
+        cache_key = str(config_path)
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        cached = _API_KEY_CACHE.get(cache_key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        api_key = self._parse_api_key(config_path)
+        _API_KEY_CACHE[cache_key] = (mtime_ns, api_key)
+        return api_key
+
+    def _parse_api_key(self, config_path: Path) -> Optional[str]:
+        """Extract the GUI API key from a Syncthing config.xml."""
+        try:
+            data = config_path.read_bytes()
+        except OSError:
+            return None
+
+        match = _APIKEY_RE.search(data)
+        if match:
+            return match.group(1).decode().strip()
+
+        # Fall back to an XML parse for unusual layouts (CDATA, entities),
+        # stopping at the first <apikey> instead of building the whole tree
+        try:
+            for _, elem in ET.iterparse(io.BytesIO(data), events=("end",)):
+                if elem.tag == "apikey":
+                    return elem.text
+                elem.clear()
+        except Exception as e:
+            self._logger.warning(f"Could not read Syncthing API key: {e}")
 
         return None
 
     def _get_headers(self) -> dict[str, str]:
         """Get HTTP headers for API requests."""
-        headers = {}
-        if self._api_key:
-            headers["X-API-Key"] = self._api_key
-        return headers
+        return self._headers
 
     def is_healthy(self) -> bool:
         """Check if Syncthing is responding."""
         try:
-            resp = requests.get(
-                f"{self._api_url}/rest/system/ping",
-                headers=self._get_headers(),
-                timeout=5,
-            )
-            return resp.status_code == 200
+            return self._session.get(
+                self._ping_url, headers=self._headers, timeout=5
+            ).status_code == 200
         except requests.RequestException:
             return False
 
@@ -88,7 +148,18 @@ class SyncthingBackend(Backend):
         return self._rescan_folder(local_path)
 
     def _rescan_folder(self, local_path: str) -> bool:
-        """Trigger a rescan of a folder."""
+        """
+        Trigger a rescan of a folder.
+
+        Skipped (no API call at all) when the local tree is unchanged since
+        the last successful rescan, so no-op events don't make Syncthing
+        rescan and wake its peers.
+        """
+        signature = tree_signature(local_path)
+        if self._last_scan_signature.get(local_path) == signature:
+            self._logger.debug(f"No local changes since last rescan: {local_path}")
+            return True
+
         # First, get the folder ID for this path
         folder_id = self._get_folder_id(local_path)
         if not folder_id:
@@ -96,46 +167,69 @@ class SyncthingBackend(Backend):
             return True  # Not an error, just not managed by Syncthing
 
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 f"{self._api_url}/rest/db/scan",
-                headers=self._get_headers(),
+                headers=self._headers,
                 params={"folder": folder_id},
                 timeout=10,
             )
-            return resp.status_code == 200
+            if resp.status_code != 200:
+                # The folder may have been removed; re-fetch the map next time
+                self._folder_cache = None
+                return False
+            self._last_scan_signature[local_path] = signature
+            return True
         except requests.RequestException as e:
             self._logger.error(f"Failed to trigger rescan: {e}")
             return False
 
     def _get_folder_id(self, local_path: str) -> Optional[str]:
         """Get the Syncthing folder ID for a local path."""
+        folders = self._get_folder_map()
+        if folders is None:
+            return None
+        return folders.get(os.path.realpath(os.path.expanduser(local_path)))
+
+    def _get_folder_map(self) -> Optional[dict[str, str]]:
+        """
+        Get {resolved folder path: folder ID}, cached for FOLDER_CACHE_TTL.
+
+        Returns:
+            The map, or None if Syncthing couldn't be asked.
+        """
+        cached = self._folder_cache
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < FOLDER_CACHE_TTL:
+            return cached[1]
+
         try:
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self._api_url}/rest/config/folders",
-                headers=self._get_headers(),
+                headers=self._headers,
                 timeout=5,
             )
             if resp.status_code != 200:
+                self._folder_cache = None
                 return None
 
-            folders = resp.json()
-            local_path = str(expand_path(local_path))
-
-            for folder in folders:
-                folder_path = str(expand_path(folder.get("path", "")))
-                if folder_path == local_path:
-                    return folder.get("id")
-
-            return None
+            folders = {
+                os.path.realpath(os.path.expanduser(folder.get("path", ""))): folder["id"]
+                for folder in resp.json()
+                if folder.get("id")
+            }
         except requests.RequestException:
+            self._folder_cache = None
             return None
 
+        self._folder_cache = (now, folders)
+        return folders
+
     def get_device_id(self) -> Optional[str]:
         """Get this device's Syncthing device ID."""
         try:
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self._api_url}/rest/system/status",
-                headers=self._get_headers(),
+                headers=self._headers,
                 timeout=5,
             )
             if resp.status_code == 200:
@@ -153,36 +247,96 @@ class SyncthingBackend(Backend):
         statuses = {}
         try:
             # Get list of folders
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self._api_url}/rest/config/folders",
-                headers=self._get_headers(),
+                headers=self._headers,
                 timeout=5,
             )
             if resp.status_code != 200:
                 return statuses
 
-            folders = resp.json()
-            for folder in folders:
-                folder_id = folder.get("id")
-                if not folder_id:
-                    continue
-
-                # Get status for each folder
-                status_resp = requests.get(
-                    f"{self._api_url}/rest/db/status",
-                    headers=self._get_headers(),
-                    params={"folder": folder_id},
-                    timeout=5,
-                )
-                if status_resp.status_code == 200:
-                    state = status_resp.json().get("state", "unknown")
-                    statuses[folder_id] = state
+            folder_ids = [f["id"] for f in resp.json() if f.get("id")]
+            if not folder_ids:
+                return statuses
+
+            # Query every folder at once over the pooled connections, so
+            # the total wait is one round trip rather than one per folder
+            status_url = f"{self._api_url}/rest/db/status"
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(folder_ids)), thread_name_prefix="syncthing-status"
+            ) as pool:
+                futures = {
+                    pool.submit(
+                        self._session.get,
+                        status_url,
+                        headers=self._headers,
+                        params={"folder": folder_id},
+                        timeout=5,
+                    ): folder_id
+                    for folder_id in folder_ids
+                }
+                for future in as_completed(futures):
+                    status_resp = future.result()
+                    if status_resp.status_code == 200:
+                        state = status_resp.json().get("state", "unknown")
+                        statuses[futures[future]] = state
 
             return statuses
         except requests.RequestException as e:
             self._logger.warning(f"Failed to get folder statuses: {e}")
             return statuses
 
+    def _local_completion_idle(self) -> Optional[bool]:
+        """
+        Check in one request whether this device has anything left to sync.
+
+        Asks /rest/db/completion for the local device across all folders
+        (an aggregate), instead of one /rest/db/status call per folder.
+
+        Pending items alone don't mean Syncthing is busy: an idle folder
+        keeps needing items while the only peer holding them is offline,
+        or when they fail to sync. So only "nothing pending" is a final
+        answer; anything else is settled from the folder states.
+
+        Returns:
+            True if nothing is pending, False if items are pending, or None
+            if the aggregate isn't available (older Syncthing, or a server
+            error), in which case per-folder statuses must be used.
+        """
+        if self._completion_supported is False:
+            return None
+
+        if self._device_id is None:
+            self._device_id = self.get_device_id()
+            if self._device_id is None:
+                return None
+
+        try:
+            resp = self._session.get(
+                f"{self._api_url}/rest/db/completion",
+                headers=self._headers,
+                params={"device": self._device_id},
+                timeout=5,
+            )
+        except requests.RequestException:
+            return None
+
+        if resp.status_code != 200:
+            if resp.status_code in (400, 404):
+                self._completion_supported = False
+            elif resp.status_code >= 500:
+                # Possibly a stale device ID (e.g. Syncthing was reset);
+                # look it up again next time and use the folders for now
+                self._device_id = None
+            return None
+
+        self._completion_supported = True
+        completion = resp.json()
+        pending = completion.get("needItems", 0) + completion.get("needDeletes", 0)
+        if pending:
+            self._logger.debug(f"Syncthing has {pending} items left to sync")
+        return pending == 0
+
     def is_idle(self) -> bool:
         """Check if all Syncthing folders are idle (not syncing).
 
@@ -192,6 +346,11 @@ class SyncthingBackend(Backend):
         if not self.is_healthy():
             return True  # Can't check, assume idle
 
+        # Nothing pending settles it in one request; otherwise only an
+        # active folder state (scanning, syncing, ...) counts as busy
+        if self._local_completion_idle():
+            return True
+
         statuses = self.get_folder_statuses()
         if not statuses:
             return True  # No folders or couldn't get status
@@ -202,22 +361,78 @@ class SyncthingBackend(Backend):
                 return False
         return True
 
+    def _wait_events(self, since: int, timeout: float) -> Optional[list[dict]]:
+        """
+        Long-poll /rest/events for folder state changes.
+
+        Blocks until a StateChanged event newer than `since` occurs or the
+        timeout passes (then returns an empty list).
+
+        Returns:
+            The new events, or None if the events API can't be used.
+        """
+        try:
+            resp = self._session.get(
+                f"{self._api_url}/rest/events",
+                headers=self._headers,
+                params={"since": since, "events": "StateChanged", "timeout": int(timeout)},
+                timeout=timeout + 5,
+            )
+        except requests.RequestException as e:
+            self._logger.debug(f"Syncthing events request failed: {e}")
+            return None
+        if resp.status_code != 200:
+            return None
+        return resp.json() or []
+
     def wait_for_idle(self, timeout: float = 60, poll_interval: float = 2) -> bool:
         """Wait for all Syncthing folders to become idle.
 
+        Sleeps on Syncthing's event stream and re-checks the folder states
+        when a folder turns idle, or at least every 15 poll intervals,
+        rather than polling them on a timer. Falls back to polling if the
+        events API fails.
+
         Args:
             timeout: Maximum seconds to wait.
-            poll_interval: Seconds between status checks.
+            poll_interval: Seconds between status checks (when polling).
 
         Returns:
             True if idle within timeout, False if timed out.
         """
-        start = time.time()
-        while time.time() - start < timeout:
-            if self.is_idle():
+        deadline = time.monotonic() + timeout
+        use_events = True
+        check = True
+        while True:
+            if check and self.is_idle():
                 return True
-            self._logger.debug(f"Waiting for Syncthing to idle...")
-            time.sleep(poll_interval)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._logger.debug("Waiting for Syncthing to idle...")
+
+            since = self._last_event_id
+            events = (
+                self._wait_events(since, max(1.0, min(remaining, poll_interval * 15)))
+                if use_events else None
+            )
+            if events is None:
+                use_events = False
+                check = True
+                time.sleep(min(poll_interval, remaining))
+                continue
+
+            if not events or events[-1].get("id", 0) < since:
+                # Quiet for a whole poll, or Syncthing restarted and numbers
+                # its events from 1 again: start over from the current
+                # stream and re-check the state directly
+                self._last_event_id = 0
+                check = True
+                continue
+
+            self._last_event_id = events[-1].get("id", 0)
+            # Folder states only become idle through a StateChanged event
+            check = any(event.get("data", {}).get("to") == "idle" for event in events)
 
         self._logger.warning(f"Syncthing did not idle within {timeout}s")
         return False
@@ -268,14 +483,34 @@ subprocess.Popen(
                 capture_output=True,
             )
             if result.returncode != 0:
-                subprocess.Popen(
+                self._child = subprocess.Popen(
                     [exe_path, "serve", "--no-browser"],
                     start_new_session=True,
                 )
 
-        # Wait and verify
-        time.sleep(5)
-        return self.is_healthy()
+        # Wait until it answers (or give up)
+        return self._wait_for_health(True, timeout=30)
+
+    def _wait_for_health(self, healthy: bool, timeout: float) -> bool:
+        """
+        Poll is_healthy() until it returns the wanted value.
+
+        Backs off from 100 ms to 1 s between probes, so a fast start or stop
+        is noticed almost immediately while a slow one still gets the full
+        timeout.
+
+        Returns:
+            True if the wanted state was reached within the timeout.
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.1
+        while True:
+            if self.is_healthy() == healthy:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
 
     def stop(self) -> bool:
         """Stop Syncthing."""
@@ -283,39 +518,43 @@ subprocess.Popen(
 
         # Try API shutdown first
         try:
-            requests.post(
+            self._session.post(
                 f"{self._api_url}/rest/system/shutdown",
-                headers=self._get_headers(),
+                headers=self._headers,
                 timeout=5,
             )
-            time.sleep(2)
-            if not self.is_healthy():
+            if self._wait_for_health(False, timeout=5):
+                if self._child is not None and self._child.poll() is not None:
+                    self._child = None  # exited (and now reaped)
                 return True
         except requests.RequestException:
             pass
 
-        # Fall back to killing process
-        if sys.platform == "win32":
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = 0
+        # Fall back to killing the process: signal our own child directly
+        # when we started it, otherwise find it by name
+        child, self._child = self._child, None
+        if child is not None and child.poll() is None:
+            child.terminate()
+            try:
+                child.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                child.kill()
+                child.wait()
+        elif sys.platform == "win32":
             subprocess.run(
                 ["taskkill", "/f", "/im", "syncthing.exe"],
                 capture_output=True,
-                startupinfo=startupinfo,
-                creationflags=subprocess.CREATE_NO_WINDOW,
+                **self._subprocess_args,
             )
         else:
             subprocess.run(["pkill", "syncthing"], capture_output=True)
 
-        time.sleep(2)
-        return not self.is_healthy()
+        return self._wait_for_health(False, timeout=5)
 
     def restart(self) -> bool:
         """Restart Syncthing."""
         self._logger.warning("Restarting Syncthing...")
         self.stop()
-        time.sleep(2)
         return self.start()
 
     def __repr__(self) -> str:
@@ -9,6 +9,7 @@ from typing import Any
 
 from dgmt.canvas.models import Assignment
 from dgmt.core.config import get_timezone
+from dgmt.utils import jsonio
 from dgmt.utils.paths import ensure_parent_exists, expand_path
 
 
@@ -26,16 +27,14 @@ class CompletionStore:
         """Load completion state from disk."""
         if self._path.exists():
             try:
-                with open(self._path) as f:
-                    self._data = json.load(f)
+                self._data = jsonio.loads(self._path.read_bytes())
             except (json.JSONDecodeError, KeyError):
                 self._data = {"version": 1, "completed": {}}
 
     def save(self) -> None:
         """Save completion state to disk."""
         ensure_parent_exists(self._path)
-        with open(self._path, "w") as f:
-            json.dump(self._data, f, indent=2)
+        self._path.write_bytes(jsonio.dumps(self._data))
 
     @property
     def completed(self) -> dict[str, Any]:
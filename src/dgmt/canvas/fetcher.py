@@ -13,6 +13,7 @@ from dgmt.canvas.completion import CompletionStore
 from dgmt.canvas.models import Assignment
 from dgmt.canvas.parser import parse_ics
 from dgmt.core.config import CanvasConfig
+from dgmt.utils import jsonio
 from dgmt.utils.paths import ensure_parent_exists, expand_path
 
 
@@ -86,8 +87,7 @@ class CanvasFetcher:
     def _load_cache(self) -> Optional[list[Assignment]]:
         """Load assignments from the cache file."""
         try:
-            with open(self._cache_path) as f:
-                data = json.load(f)
+            data = jsonio.loads(self._cache_path.read_bytes())
             return [Assignment.from_dict(d) for d in data]
         except (json.JSONDecodeError, KeyError, FileNotFoundError):
             return None
@@ -95,8 +95,7 @@ class CanvasFetcher:
     def _save_cache(self, assignments: list[Assignment]) -> None:
         """Save assignments to the cache file."""
         ensure_parent_exists(self._cache_path)
-        with open(self._cache_path, "w") as f:
-            json.dump([a.to_dict() for a in assignments], f, indent=2)
+        self._cache_path.write_bytes(jsonio.dumps([a.to_dict() for a in assignments]))
 
     @property
     def completion_store(self) -> CompletionStore:
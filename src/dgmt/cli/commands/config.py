@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import argparse
 import os
-import subprocess
+import shutil
 import sys
 
 from dgmt.cli.formatters import print_error, print_info, print_json, print_success
@@ -28,13 +28,26 @@ def cmd_config(args: argparse.Namespace) -> int:
     else:
         print(f"Config file: {config_file}")
         print()
-        print(config_file.read_text())
+        # Copy the raw bytes to the terminal instead of decoding the whole
+        # file into a str only to encode it again
+        out = getattr(sys.stdout, "buffer", None)
+        if out is None:
+            # Replaced text-only stream (test capture, StringIO, IDE console)
+            sys.stdout.write(config_file.read_text() + "\n")
+        else:
+            sys.stdout.flush()
+            with open(config_file, "rb") as f:
+                shutil.copyfileobj(f, out)
+            out.write(b"\n")
+            out.flush()
 
     return 0
 
 
 def cmd_config_edit(args: argparse.Namespace) -> int:
     """Open config file in editor."""
+    import subprocess
+
     from dgmt.utils.paths import get_config_file
 
     config_file = get_config_file()
@@ -110,12 +123,11 @@ def cmd_config_add_watch(args: argparse.Namespace) -> int:
 
     config = Config()
 
-    if expanded in config.data.hub.watch_paths:
+    if config.is_watching(path):
         print_info(f"Path already being watched: {expanded}")
         return 0
 
-    config.watch(str(path))
-    config.save()
+    config.watch(path).save()
 
     print_success(f"Now watching: {expanded}")
     return 0
@@ -131,12 +143,11 @@ def cmd_config_remove_watch(args: argparse.Namespace) -> int:
 
     config = Config()
 
-    if expanded not in config.data.hub.watch_paths:
+    if not config.is_watching(path):
         print_error(f"Path is not being watched: {expanded}")
         return 1
 
-    config.data.hub.watch_paths.remove(expanded)
-    config.save()
+    config.unwatch(path).save()
 
     print_success(f"Removed from watch list: {expanded}")
     return 0
@@ -156,8 +167,8 @@ def cmd_config_tz(args: argparse.Namespace) -> int:
             # Filter to common regions
             common_prefixes = ("US/", "America/", "Europe/", "Asia/", "Pacific/", "Australia/")
             zones = [z for z in zones if any(z.startswith(p) for p in common_prefixes)]
-        for z in zones:
-            print(z)
+        if zones:
+            sys.stdout.write("\n".join(zones) + "\n")
         return 0
 
     if args.name:
@@ -3,6 +3,12 @@
 from __future__ import annotations
 
 import argparse
+import codecs
+import io
+import os
+import sys
+from pathlib import Path
+from typing import BinaryIO, Iterator
 
 from dgmt.cli.formatters import print_error, print_info, print_success, print_warning
 from dgmt.service.factory import get_service_manager, get_platform_name, is_service_supported
@@ -130,112 +136,212 @@ def cmd_stop(args: argparse.Namespace) -> int:
 
 def cmd_status(args: argparse.Namespace) -> int:
     """Show service and sync status."""
-    from dgmt.cli.formatters import print_header, print_status
-    from dgmt.core.config import Config
+    from dgmt.cli.formatters import OutputBuffer, emit, print_header, print_status
+    from dgmt.core.config import load_config
+
+    # Buffer the report so it reaches the terminal in one write
+    with OutputBuffer():
+        # Service status
+        print_header("Service Status")
+
+        if is_service_supported():
+            try:
+                manager = get_service_manager()
+                status = manager.status()
+                print_status("dgmt", status.status.value)
+                if status.pid:
+                    emit(f"    PID: {status.pid}")
+            except Exception as e:
+                print_error(f"Could not get service status: {e}")
+        else:
+            print_info(f"Service management not available ({get_platform_name()})")
+
+        # Configuration status
+        print_header("Configuration")
+        try:
+            config = load_config()
+            data = config.data
+
+            emit(f"Config file: {config._config_path}")
+            emit(f"Watch paths: {len(data.hub.watch_paths)}")
+            for path in data.hub.watch_paths:
+                emit(f"  - {path}")
+
+            emit(f"Default backend: {data.defaults.get('backend', 'syncthing')}")
+            emit(f"rclone enabled: {data.backends.rclone_enabled}")
 
-    # Service status
-    print_header("Service Status")
+        except Exception as e:
+            print_error(f"Could not load config: {e}")
 
-    if is_service_supported():
+        # Spokes status
+        print_header("Spokes")
         try:
-            manager = get_service_manager()
-            status = manager.status()
-            print_status("dgmt", status.status.value)
-            if status.pid:
-                print(f"    PID: {status.pid}")
+            config = load_config()
+            spokes = config.data.spokes
+
+            if not spokes:
+                print_info("No spokes configured")
+            else:
+                for name, spoke in spokes.items():
+                    status = "enabled" if spoke.enabled else "disabled"
+                    print_status(name, status, f"backend={spoke.backend}")
+
         except Exception as e:
-            print_error(f"Could not get service status: {e}")
-    else:
-        print_info(f"Service management not available ({get_platform_name()})")
+            print_error(f"Could not load spokes: {e}")
 
-    # Configuration status
-    print_header("Configuration")
-    try:
-        config = Config()
-        data = config.data
+    return 0
 
-        print(f"Config file: {config._config_path}")
-        print(f"Watch paths: {len(data.hub.watch_paths)}")
-        for path in data.hub.watch_paths:
-            print(f"  - {path}")
 
-        print(f"Default backend: {data.defaults.get('backend', 'syncthing')}")
-        print(f"rclone enabled: {data.backends.rclone_enabled}")
+def _tail_offset(f: BinaryIO, n: int, block_size: int = 8192) -> int:
+    """
+    Find where the last n lines of a binary file start.
+
+    Reads fixed-size blocks backwards from the end until enough newlines
+    have been seen, so only the tail of a large file is ever touched.
+    """
+    end = f.seek(0, os.SEEK_END)
+    if n <= 0:
+        return end
+    # A trailing newline ends the last line rather than starting a new one
+    pos = max(end - 1, 0)
+    remaining = n
+    while pos > 0:
+        step = min(block_size, pos)
+        pos -= step
+        f.seek(pos)
+        block = f.read(step)
+        count = block.count(b"\n")
+        if count >= remaining:
+            idx = len(block)
+            for _ in range(remaining):
+                idx = block.rindex(b"\n", 0, idx)
+            return pos + idx + 1
+        remaining -= count
+    return 0
 
-    except Exception as e:
-        print_error(f"Could not load config: {e}")
 
-    # Spokes status
-    print_header("Spokes")
+def _write_range(f: BinaryIO, start: int, end: int) -> None:
+    """
+    Copy bytes [start, end) of a file to stdout.
+
+    Uses os.sendfile so the bytes go file-to-terminal inside the kernel
+    without a decode/encode round trip. Falls back to reading and writing
+    through sys.stdout where sendfile is unavailable or refuses stdout.
+    """
+    sys.stdout.flush()
+    offset = start
+    if hasattr(os, "sendfile"):
+        try:
+            out_fd = sys.stdout.fileno()
+            while offset < end:
+                sent = os.sendfile(out_fd, f.fileno(), offset, end - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            return
+        except (OSError, ValueError, io.UnsupportedOperation):
+            pass
+
+    f.seek(offset)
+    sys.stdout.write(f.read(end - offset).decode("utf-8", errors="replace"))
+    sys.stdout.flush()
+
+
+def _log_wakeups(log_file: Path) -> Iterator[None]:
+    """
+    Yield whenever the log file may have new content.
+
+    Blocks on filesystem events via watchfiles when it is installed, so an
+    idle log costs nothing and new lines show up within milliseconds. Also
+    yields about once a second regardless. Without watchfiles, Linux blocks
+    on inotify directly; elsewhere it falls back to polling every 0.5 s.
+    """
     try:
-        config = Config()
-        spokes = config.data.spokes
+        from watchfiles import watch
+    except ImportError:
+        from dgmt.utils.inotify import file_wakeups
 
-        if not spokes:
-            print_info("No spokes configured")
-        else:
-            for name, spoke in spokes.items():
-                status = "enabled" if spoke.enabled else "disabled"
-                print_status(name, status, f"backend={spoke.backend}")
+        events = file_wakeups(log_file)
+        if events is not None:
+            yield from events
+            return
 
-    except Exception as e:
-        print_error(f"Could not load spokes: {e}")
+        import time
 
-    return 0
+        while True:
+            time.sleep(0.5)
+            yield
+
+    target = os.path.realpath(log_file)
+    for changes in watch(log_file.parent, rust_timeout=1000, yield_on_timeout=True):
+        if not changes or any(os.path.realpath(path) == target for _, path in changes):
+            yield
 
 
 def cmd_logs(args: argparse.Namespace) -> int:
     """Tail and follow the dgmt log file."""
-    import time
-    from dgmt.core.config import Config
+    from dgmt.core.config import load_config
     from dgmt.utils.paths import get_log_file
 
     try:
-        config = Config()
+        config = load_config()
         log_file = config.data.logging.file
     except Exception:
         log_file = get_log_file()
 
-    if not log_file.exists():
+    # Open first rather than checking exists(): one lookup, no race
+    try:
+        f = open(log_file, "rb")
+    except FileNotFoundError:
         print_error(f"Log file not found: {log_file}")
         return 1
 
     print_info(f"Following {log_file} (Ctrl+C to stop)\n")
 
     lines_to_show = args.lines
+    # Decodes across reads, so a character split between writes survives
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
 
     try:
-        with open(log_file, "r", encoding="utf-8", errors="replace") as f:
-            # Show last N lines initially
-            if lines_to_show > 0:
-                # Read all lines and show last N
-                all_lines = f.readlines()
-                for line in all_lines[-lines_to_show:]:
-                    print(line, end="")
-
-            # Follow mode - seek to end and poll for new content
-            f.seek(0, 2)  # Seek to end
-            last_pos = f.tell()
-            last_size = log_file.stat().st_size
-
-            while True:
-                # Check if file was truncated/rotated
-                current_size = log_file.stat().st_size
-                if current_size < last_size:
-                    # File was truncated, start from beginning
-                    f.seek(0)
-                    print_info("--- Log file rotated ---")
-
-                # Read new content
-                line = f.readline()
-                if line:
-                    print(line, end="")
-                    last_pos = f.tell()
-                else:
-                    # No new content, wait a bit
-                    time.sleep(0.5)
-
-                last_size = current_size
+        # Show last N lines initially
+        end = f.seek(0, os.SEEK_END)
+        if lines_to_show > 0:
+            _write_range(f, _tail_offset(f, lines_to_show), end)
+
+        # Follow mode - continue from where the initial tail stopped
+        f.seek(end)
+        inode = os.fstat(f.fileno()).st_ino
+        wakeups = _log_wakeups(log_file)
+
+        while True:
+            next(wakeups)
+
+            # Truncated in place: the open file is now shorter than our
+            # position. fstat on the fd skips the path lookup.
+            if os.fstat(f.fileno()).st_size < f.tell():
+                f.seek(0)
+                print_info("--- Log file rotated ---")
+
+            # Write everything new in one go
+            data = f.read()
+            if not data:
+                # Nothing new: the path may name a new file now (rotation
+                # by rename). Only checked while the old file is quiet.
+                try:
+                    path_inode = os.stat(log_file).st_ino
+                except FileNotFoundError:
+                    continue  # rotated away, new file not created yet
+                if path_inode == inode:
+                    continue
+                f.close()
+                f = open(log_file, "rb")
+                inode = os.fstat(f.fileno()).st_ino
+                print_info("--- Log file rotated ---")
+                data = f.read()
+
+            if data:
+                sys.stdout.write(decoder.decode(data))
+                sys.stdout.flush()
 
     except KeyboardInterrupt:
         print("\n")
@@ -243,6 +349,8 @@ def cmd_logs(args: argparse.Namespace) -> int:
     except Exception as e:
         print_error(f"Error reading log: {e}")
         return 1
+    finally:
+        f.close()
 
 
 def register_commands(subparsers: argparse._SubParsersAction) -> None:
@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 
 from dgmt.cli.formatters import (
+    emit,
     print_error,
     print_header,
     print_info,
@@ -17,7 +18,7 @@ from dgmt.cli.formatters import (
 
 def cmd_remote_add(args: argparse.Namespace) -> int:
     """Add a remote spoke machine."""
-    from dgmt.core.config import Config
+    from dgmt.core.config import load_config
     from dgmt.remote.config_parser import SSHConfigParser
     from dgmt.remote.ssh import SSHConnection
     from dgmt.remote.setup import RemoteSetup
@@ -26,22 +27,23 @@ def cmd_remote_add(args: argparse.Namespace) -> int:
     backend = args.backend or "syncthing"
     folder = args.folder or "~/sync"
 
-    # Check SSH config
+    # Check SSH config. Resolve once and hand the result to the connection
+    # and setup helpers below so they don't look the host up again.
     ssh_config = SSHConfigParser()
-    if ssh_config.has_host(host):
-        host_info = ssh_config.get_host(host)
+    host_info = ssh_config.resolve(host)
+    if host in ssh_config:
         print_info(f"Found SSH config for '{host}':")
-        print(f"  Hostname: {host_info.hostname or host}")
+        emit(f"  Hostname: {host_info.hostname or host}")
         if host_info.user:
-            print(f"  User: {host_info.user}")
+            emit(f"  User: {host_info.user}")
         if host_info.port != 22:
-            print(f"  Port: {host_info.port}")
+            emit(f"  Port: {host_info.port}")
     else:
         print_info(f"Using '{host}' as hostname (not in SSH config)")
 
     # Test connection
     print_info(f"Testing connection to {host}...")
-    ssh = SSHConnection(host)
+    ssh = SSHConnection(host, resolved=host_info)
     if not ssh.test_connection():
         print_error(f"Cannot connect to {host}")
         print_info("Check your SSH config and try again")
@@ -52,7 +54,7 @@ def cmd_remote_add(args: argparse.Namespace) -> int:
     # Set up remote
     if args.setup:
         print_info("Setting up remote...")
-        setup = RemoteSetup(host)
+        setup = RemoteSetup(host, resolved=host_info)
 
         if not setup.full_setup(sync_folder=folder, backend=backend):
             print_error("Remote setup failed")
@@ -61,7 +63,7 @@ def cmd_remote_add(args: argparse.Namespace) -> int:
         print_success("Remote setup complete")
 
     # Add to config
-    config = Config()
+    config = load_config()
     config.add_spoke(
         name=host,
         backend=backend,
@@ -76,10 +78,10 @@ def cmd_remote_add(args: argparse.Namespace) -> int:
 
 def cmd_remote_remove(args: argparse.Namespace) -> int:
     """Remove a remote spoke machine."""
-    from dgmt.core.config import Config
+    from dgmt.core.config import load_config
 
     host = args.host
-    config = Config()
+    config = load_config()
 
     if host not in config.data.spokes:
         print_error(f"Spoke '{host}' not found")
@@ -94,9 +96,9 @@ def cmd_remote_remove(args: argparse.Namespace) -> int:
 
 def cmd_remote_list(args: argparse.Namespace) -> int:
     """List configured remote spokes."""
-    from dgmt.core.config import Config
+    from dgmt.core.config import load_config
 
-    config = Config()
+    config = load_config()
     spokes = config.data.spokes
 
     if not spokes:
@@ -119,20 +121,20 @@ def cmd_remote_list(args: argparse.Namespace) -> int:
 
 def cmd_remote_status(args: argparse.Namespace) -> int:
     """Check status of a remote spoke."""
-    from dgmt.core.config import Config
+    from dgmt.core.config import load_config
     from dgmt.remote.spoke import Spoke
 
     host = args.host
 
     # Check if in config
-    config = Config()
+    config = load_config()
     spoke_config = config.get_spoke(host)
 
     if spoke_config:
         print_header(f"Spoke: {host}")
-        print(f"Backend: {spoke_config.backend}")
-        print(f"Remote path: {spoke_config.remote_path or '~/sync'}")
-        print(f"Enabled: {'yes' if spoke_config.enabled else 'no'}")
+        emit(f"Backend: {spoke_config.backend}")
+        emit(f"Remote path: {spoke_config.remote_path or '~/sync'}")
+        emit(f"Enabled: {'yes' if spoke_config.enabled else 'no'}")
     else:
         print_warning(f"'{host}' is not configured as a spoke")
 
@@ -147,10 +149,10 @@ def cmd_remote_status(args: argparse.Namespace) -> int:
 
 def cmd_remote_start(args: argparse.Namespace) -> int:
     """Start sync on a remote spoke."""
-    from dgmt.core.config import Config
+    from dgmt.core.config import load_config
 
     host = args.host
-    config = Config()
+    config = load_config()
 
     spoke_config = config.get_spoke(host)
     if not spoke_config:
@@ -170,10 +172,10 @@ def cmd_remote_start(args: argparse.Namespace) -> int:
 
 def cmd_remote_stop(args: argparse.Namespace) -> int:
     """Stop sync on a remote spoke."""
-    from dgmt.core.config import Config
+    from dgmt.core.config import load_config
 
     host = args.host
-    config = Config()
+    config = load_config()
 
     spoke_config = config.get_spoke(host)
     if not spoke_config:
@@ -186,10 +188,10 @@ def cmd_remote_stop(args: argparse.Namespace) -> int:
 
 def cmd_remote_push_config(args: argparse.Namespace) -> int:
     """Push portable config (color rules, calendar settings) to spokes."""
-    from dgmt.core.config import Config
+    from dgmt.core.config import load_config
     from dgmt.remote.config_sync import push_config_to_spoke, push_config_to_all_spokes
 
-    config = Config()
+    config = load_config()
     host = getattr(args, "host", None)
 
     if host:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from dgmt.cli.formatters import print_error, print_info, print_success
 
@@ -31,10 +32,10 @@ def cmd_run(args: argparse.Namespace) -> int:
 
 def cmd_sync(args: argparse.Namespace) -> int:
     """Trigger manual sync."""
-    from dgmt.core.config import Config
+    from dgmt.core.config import load_config
     from dgmt.backends import get_backend
 
-    config = Config()
+    config = load_config()
     data = config.data
 
     if not data.backends.rclone_enabled:
@@ -47,38 +48,65 @@ def cmd_sync(args: argparse.Namespace) -> int:
         remote=data.backends.rclone_remote,
         dest=data.backends.rclone_dest,
         flags=data.backends.rclone_flags,
+        transfers=data.backends.rclone_transfers,
+        checkers=data.backends.rclone_checkers,
+        fast_list=data.backends.rclone_fast_list,
+        drive_chunk_size=data.backends.rclone_drive_chunk_size,
+        multi_thread_streams=data.backends.rclone_multi_thread_streams,
+        use_rcd=data.backends.rclone_use_rcd,
     )
 
-    success = True
-
-    for path in data.hub.watch_paths:
-        print_info(f"Syncing {path}...")
+    paths = [str(path) for path in data.hub.watch_paths]
+    if not paths:
+        print_info("No watch paths configured")
+        return 0
 
-        if args.pull:
-            if rclone.pull(str(path)):
-                print_success(f"Pull completed: {path}")
-            else:
-                print_error(f"Pull failed: {path}")
-                success = False
+    if args.pull:
+        action = "Pull"
+    elif args.push:
+        action = "Push"
+    else:
+        action = "Sync"
 
-        elif args.push:
-            if rclone.push(str(path)):
-                print_success(f"Push completed: {path}")
-            else:
-                print_error(f"Push failed: {path}")
-                success = False
+    success = True
 
-        else:
-            # Bidirectional sync
-            if rclone.sync(str(path)):
-                print_success(f"Sync completed: {path}")
+    # rclone only serialises operations on the same path, so distinct watch
+    # paths can transfer at once; results are printed from this thread.
+    with ThreadPoolExecutor(
+        max_workers=min(8, len(paths)), thread_name_prefix="dgmt-sync"
+    ) as executor:
+        futures = {}
+        for path in paths:
+            print_info(f"Syncing {path}...")
+            futures[executor.submit(_sync_one, rclone, path, args)] = path
+
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                ok = future.result()
+            except Exception as e:
+                print_error(f"{action} failed: {path} ({e})")
+                ok = False
             else:
-                print_error(f"Sync failed: {path}")
-                success = False
+                if ok:
+                    print_success(f"{action} completed: {path}")
+                else:
+                    print_error(f"{action} failed: {path}")
+            success = success and ok
 
     return 0 if success else 1
 
 
+def _sync_one(rclone, path: str, args: argparse.Namespace) -> bool:
+    """Run the pull, push or bidirectional sync requested by args for one path."""
+    if args.pull:
+        return rclone.pull(path)
+    if args.push:
+        return rclone.push(path)
+    # Bidirectional sync
+    return rclone.sync(path)
+
+
 def cmd_init(args: argparse.Namespace) -> int:
     """Initialize dgmt configuration."""
     from dgmt.core.config import Config, init_config
@@ -2,8 +2,123 @@
 
 from __future__ import annotations
 
+import atexit
 import json
-from typing import Any
+import queue
+import sys
+import threading
+from typing import Any, Optional, Union
+
+# Output waiting for the background writer, once enable_queued_output() has
+# been called. Items are text to write, or an Event to set once everything
+# queued before it has been written.
+_OUTPUT_QUEUE: Optional[queue.SimpleQueue[Union[str, threading.Event]]] = None
+
+
+def _output_writer(q: queue.SimpleQueue[Union[str, threading.Event]]) -> None:
+    """Drain the output queue into stdout, one write per batch of items."""
+    while True:
+        items = [q.get()]
+        while True:
+            try:
+                items.append(q.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            sys.stdout.write("".join(item for item in items if isinstance(item, str)))
+            sys.stdout.flush()
+        except (OSError, ValueError):
+            pass
+        for item in items:
+            if isinstance(item, threading.Event):
+                item.set()
+
+
+def enable_queued_output() -> None:
+    """
+    Hand stdout writes to a background thread.
+
+    Command logic then never blocks on a slow stdout (e.g. a pipe into
+    journald). Output order is preserved; call flush_output() before
+    writing to stdout or stderr directly.
+    """
+    global _OUTPUT_QUEUE
+    if _OUTPUT_QUEUE is not None:
+        return
+    q: queue.SimpleQueue[Union[str, threading.Event]] = queue.SimpleQueue()
+    threading.Thread(
+        target=_output_writer, args=(q,), name="dgmt-stdout", daemon=True
+    ).start()
+    _OUTPUT_QUEUE = q
+    atexit.register(flush_output)
+
+
+def flush_output() -> None:
+    """Wait until all queued output has been written."""
+    if _OUTPUT_QUEUE is None:
+        return
+    done = threading.Event()
+    _OUTPUT_QUEUE.put(done)
+    done.wait()
+
+
+def _write(text: str) -> None:
+    """Write text to stdout, through the output queue when it is enabled."""
+    if _OUTPUT_QUEUE is not None:
+        _OUTPUT_QUEUE.put(text)
+    elif sys.stdout is not None:
+        sys.stdout.write(text)
+
+
+class OutputBuffer:
+    """
+    Collect CLI output lines and write them to stdout in one call.
+
+    While a buffer is active (``with OutputBuffer():``), the ``print_*``
+    helpers append to it instead of printing, so a command that emits many
+    lines does one write on exit rather than one locked write per line.
+    """
+
+    _local = threading.local()
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self._previous: Optional[OutputBuffer] = None
+
+    @classmethod
+    def current(cls) -> Optional[OutputBuffer]:
+        """Get the buffer active on this thread, if any."""
+        return getattr(cls._local, "buffer", None)
+
+    def append(self, text: str) -> None:
+        """Add text (one or more lines) to the buffer."""
+        self.lines.append(text)
+
+    def flush(self) -> None:
+        """Write buffered lines to stdout and empty the buffer."""
+        if self.lines:
+            _write("\n".join(self.lines) + "\n")
+            if _OUTPUT_QUEUE is None and sys.stdout is not None:
+                sys.stdout.flush()
+            self.lines.clear()
+
+    def __enter__(self) -> OutputBuffer:
+        self._previous = self.current()
+        self._local.buffer = self
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._local.buffer = self._previous
+        self.flush()
+
+
+def emit(text: str = "") -> None:
+    """Print text, or append it to the active OutputBuffer."""
+    buffer = OutputBuffer.current()
+    if buffer is not None:
+        buffer.append(text)
+    else:
+        _write(text + "\n")
 
 
 class Formatter:
@@ -26,23 +141,20 @@ class TableFormatter(Formatter):
         if not rows:
             return "(no data)"
 
-        # Calculate column widths
-        widths = {}
-        for header in self.headers:
-            min_width = self.min_widths.get(header, 0)
-            max_data_width = max(len(str(row.get(header, ""))) for row in rows)
-            widths[header] = max(len(header), max_data_width, min_width)
+        # Stringify every cell once; widths and rendering both read from it
+        cells = [[str(row.get(h, "")) for h in self.headers] for row in rows]
+        widths = [
+            max(len(h), self.min_widths.get(h, 0), max(len(row[i]) for row in cells))
+            for i, h in enumerate(self.headers)
+        ]
 
         # Build format string
-        fmt = "  ".join(f"{{:<{widths[h]}}}" for h in self.headers)
+        fmt = "  ".join(f"{{:<{w}}}" for w in widths)
 
         # Build output
         lines = [fmt.format(*self.headers)]
-        lines.append(fmt.format(*["-" * widths[h] for h in self.headers]))
-
-        for row in rows:
-            values = [str(row.get(h, "")) for h in self.headers]
-            lines.append(fmt.format(*values))
+        lines.append(fmt.format(*["-" * w for w in widths]))
+        lines.extend(fmt.format(*row) for row in cells)
 
         return "\n".join(lines)
 
@@ -72,9 +184,15 @@ class StatusFormatter:
         "syncing": "[~]",
     }
 
+    # Fully formatted text for each known status, built once
+    _FORMATTED = {status: f"{symbol} {status}" for status, symbol in STATUS_SYMBOLS.items()}
+
     @classmethod
     def format_status(cls, status: str) -> str:
         """Format a status with symbol."""
+        formatted = cls._FORMATTED.get(status)
+        if formatted is not None:
+            return formatted
         symbol = cls.STATUS_SYMBOLS.get(status.lower(), "[?]")
         return f"{symbol} {status}"
 
@@ -82,45 +200,44 @@ class StatusFormatter:
 def print_table(headers: list[str], rows: list[dict[str, Any]]) -> None:
     """Print data as a table."""
     formatter = TableFormatter(headers)
-    print(formatter.format(rows))
+    emit(formatter.format(rows))
 
 
 def print_json(data: Any) -> None:
     """Print data as JSON."""
     formatter = JsonFormatter()
-    print(formatter.format(data))
+    emit(formatter.format(data))
 
 
 def print_status(name: str, status: str, extra: str = "") -> None:
     """Print a status line."""
     formatted = StatusFormatter.format_status(status)
     if extra:
-        print(f"{formatted} {name}: {extra}")
+        emit(f"{formatted} {name}: {extra}")
     else:
-        print(f"{formatted} {name}")
+        emit(f"{formatted} {name}")
 
 
 def print_header(text: str) -> None:
     """Print a section header."""
-    print(f"\n{text}")
-    print("=" * len(text))
+    emit(f"\n{text}\n{'=' * len(text)}")
 
 
 def print_success(message: str) -> None:
     """Print a success message."""
-    print(f"[+] {message}")
+    emit(f"[+] {message}")
 
 
 def print_error(message: str) -> None:
     """Print an error message."""
-    print(f"[!] {message}")
+    emit(f"[!] {message}")
 
 
 def print_info(message: str) -> None:
     """Print an info message."""
-    print(f"[*] {message}")
+    emit(f"[*] {message}")
 
 
 def print_warning(message: str) -> None:
     """Print a warning message."""
-    print(f"[~] {message}")
+    emit(f"[~] {message}")
@@ -3,13 +3,140 @@
 from __future__ import annotations
 
 import argparse
+import importlib
 import sys
+from functools import lru_cache
+from typing import Any, Optional
 
 from dgmt import __version__
 
+# Registration function for each module's commands, in --help order.
+_COMMAND_MODULES: tuple[tuple[str, str], ...] = (
+    ("dgmt.cli.commands.install", "register_commands"),
+    ("dgmt.cli.commands.sync", "register_commands"),
+    ("dgmt.cli.commands.remote", "register_commands"),
+    ("dgmt.cli.commands.config", "register_commands"),
+    ("dgmt.calendar.cli.commands", "register_commands"),
+    ("dgmt.canvas.cli", "register_commands"),
+    ("dgmt.cli.commands.mcp", "register_mcp_commands"),
+)
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the main argument parser."""
+# Which module registers each top-level command. Lets a single invocation
+# import just the module it needs instead of every command module.
+_COMMAND_INDEX: dict[str, tuple[str, str]] = {
+    **dict.fromkeys(
+        ("install", "uninstall", "start", "stop", "status", "logs"), _COMMAND_MODULES[0]
+    ),
+    **dict.fromkeys(("run", "sync", "init"), _COMMAND_MODULES[1]),
+    "remote": _COMMAND_MODULES[2],
+    "config": _COMMAND_MODULES[3],
+    "cal": _COMMAND_MODULES[4],
+    "canvas": _COMMAND_MODULES[5],
+    "mcp": _COMMAND_MODULES[6],
+}
+
+
+# Commands simple enough to parse without building an argparse tree:
+# command -> (module, handler, options, defaults). Options map each flag to
+# its destination and type (bool for store_true). Must match the flags and
+# defaults the module's register_commands() declares.
+_FAST_COMMANDS: dict[str, tuple[str, str, dict[str, tuple[str, type]], dict[str, Any]]] = {
+    "run": ("dgmt.cli.commands.sync", "cmd_run", {}, {}),
+    "sync": (
+        "dgmt.cli.commands.sync",
+        "cmd_sync",
+        {"--pull": ("pull", bool), "--push": ("push", bool)},
+        {"pull": False, "push": False},
+    ),
+    "start": ("dgmt.cli.commands.install", "cmd_start", {}, {}),
+    "stop": ("dgmt.cli.commands.install", "cmd_stop", {}, {}),
+    "status": ("dgmt.cli.commands.install", "cmd_status", {}, {}),
+    "logs": (
+        "dgmt.cli.commands.install",
+        "cmd_logs",
+        {"-n": ("lines", int), "--lines": ("lines", int)},
+        {"lines": 20},
+    ),
+}
+
+
+# Commands whose stdout goes entirely through the cli.formatters helpers, so
+# it can safely be handed to the background writer. Others (logs, config,
+# cal, canvas, mcp) also write to stdout directly.
+_QUEUED_OUTPUT_COMMANDS = frozenset({
+    "install", "uninstall", "start", "stop", "status", "run", "sync", "init", "remote",
+})
+
+
+def _fast_parse(argv: list[str]) -> Optional[argparse.Namespace]:
+    """
+    Parse a plain invocation of one of _FAST_COMMANDS by hand.
+
+    Returns None for anything unusual (help flags, unknown or malformed
+    options), leaving argparse to handle it and produce its usual errors.
+    """
+    flags = {"quiet": False, "sync_stdout": False}
+    i = 0
+    while i < len(argv) and argv[i] in ("-q", "--quiet", "--sync-stdout"):
+        flags["sync_stdout" if argv[i] == "--sync-stdout" else "quiet"] = True
+        i += 1
+    if i >= len(argv) or argv[i] not in _FAST_COMMANDS:
+        return None
+
+    command = argv[i]
+    module_name, handler, options, defaults = _FAST_COMMANDS[command]
+    values = dict(defaults)
+    rest = argv[i + 1:]
+    while rest:
+        flag, _, inline = rest.pop(0).partition("=")
+        if flag not in options:
+            return None
+        dest, kind = options[flag]
+        if kind is bool:
+            if inline:
+                return None
+            values[dest] = True
+            continue
+        if not inline:
+            if not rest:
+                return None
+            inline = rest.pop(0)
+        try:
+            values[dest] = kind(inline)
+        except ValueError:
+            return None
+
+    func = getattr(importlib.import_module(module_name), handler)
+    return argparse.Namespace(command=command, func=func, **flags, **values)
+
+
+def _peek_command(argv: list[str]) -> Optional[str]:
+    """
+    Find the subcommand name in argv without a full parse.
+
+    Returns None when there is no known command, or when top-level help is
+    requested before one, so the caller registers everything.
+    """
+    for arg in argv:
+        if arg in ("-h", "--help"):
+            return None
+        if not arg.startswith("-"):
+            return arg if arg in _COMMAND_INDEX else None
+    return None
+
+
+@lru_cache(maxsize=8)
+def create_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Create the main argument parser.
+
+    The parser only holds the command definitions, so it is built once per
+    process (per command subset) and reused by later main() calls.
+
+    Args:
+        command: If given, only the module providing this subcommand is
+            imported and registered. Otherwise all commands are registered.
+    """
     parser = argparse.ArgumentParser(
         prog="dgmt",
         description="Dylan's General Management Tool - Hub-and-spoke sync orchestrator",
@@ -58,6 +185,13 @@ AI integration:
         help="Suppress non-essential output",
     )
 
+    parser.add_argument(
+        "--sync-stdout",
+        action="store_true",
+        help="Write output directly instead of through a background writer "
+             "when stdout is not a terminal",
+    )
+
     # Create subcommand parsers
     subparsers = parser.add_subparsers(
         dest="command",
@@ -65,26 +199,28 @@ AI integration:
         title="Commands",
     )
 
-    # Register all command modules
-    from dgmt.cli.commands import install, sync, remote, config
-    from dgmt.cli.commands.mcp import register_mcp_commands
-    from dgmt.calendar.cli.commands import register_commands as register_cal_commands
-    from dgmt.canvas.cli import register_commands as register_canvas_commands
-
-    install.register_commands(subparsers)
-    sync.register_commands(subparsers)
-    remote.register_commands(subparsers)
-    config.register_commands(subparsers)
-    register_cal_commands(subparsers)
-    register_canvas_commands(subparsers)
-    register_mcp_commands(subparsers)
+    # Register the needed command module(s)
+    if command in _COMMAND_INDEX:
+        modules = (_COMMAND_INDEX[command],)
+    else:
+        modules = _COMMAND_MODULES
+    for module_name, register in modules:
+        getattr(importlib.import_module(module_name), register)(subparsers)
 
     return parser
 
 
 def main(argv: list[str] | None = None) -> int:
     """Main entry point."""
-    parser = create_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Common invocations skip building the parser entirely
+    args = _fast_parse(argv)
+    if args is not None:
+        return _run(args)
+
+    parser = create_parser(_peek_command(argv))
     args = parser.parse_args(argv)
 
     # No command specified - show help
@@ -128,19 +264,39 @@ def main(argv: list[str] | None = None) -> int:
 
     # Execute command
     if hasattr(args, "func"):
-        try:
-            return args.func(args)
-        except KeyboardInterrupt:
-            print("\nInterrupted")
-            return 130
-        except Exception as e:
-            if not args.quiet:
-                print(f"Error: {e}", file=sys.stderr)
-            return 1
+        return _run(args)
     else:
         parser.print_help()
         return 0
 
 
+def _run(args: argparse.Namespace) -> int:
+    """Run the parsed command's handler."""
+    from dgmt.cli.formatters import emit, enable_queued_output, flush_output
+
+    # Piped or redirected output goes through a writer thread so a slow
+    # consumer doesn't stall the command; terminals stay synchronous.
+    if (
+        args.command in _QUEUED_OUTPUT_COMMANDS
+        and not args.sync_stdout
+        and sys.stdout is not None
+        and not sys.stdout.isatty()
+    ):
+        enable_queued_output()
+
+    try:
+        return args.func(args)
+    except KeyboardInterrupt:
+        emit("\nInterrupted")
+        return 130
+    except Exception as e:
+        if not args.quiet:
+            flush_output()
+            print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        flush_output()
+
+
 if __name__ == "__main__":
     sys.exit(main())
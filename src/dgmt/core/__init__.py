@@ -1,8 +1,34 @@
 """Core daemon functionality."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 from dgmt.core.config import Config
-from dgmt.core.daemon import Daemon
-from dgmt.core.watcher import ChangeSet, DebouncedWatcher
-from dgmt.core.shutdown import ShutdownHandler
+
+if TYPE_CHECKING:
+    from dgmt.core.daemon import Daemon
+    from dgmt.core.shutdown import ShutdownHandler
+    from dgmt.core.watcher import ChangeSet, DebouncedWatcher
 
 __all__ = ["ChangeSet", "Config", "Daemon", "DebouncedWatcher", "ShutdownHandler"]
+
+# Imported on first access (PEP 562): the daemon and watcher pull in
+# watchdog and the backends, which config-only users don't need.
+_LAZY_ATTRS = {
+    "ChangeSet": "dgmt.core.watcher",
+    "Daemon": "dgmt.core.daemon",
+    "DebouncedWatcher": "dgmt.core.watcher",
+    "ShutdownHandler": "dgmt.core.shutdown",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
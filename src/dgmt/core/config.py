@@ -2,17 +2,35 @@
 
 from __future__ import annotations
 
+import copy
 import json
-from dataclasses import dataclass, field
+import os
+import stat
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional, TypeVar
 from zoneinfo import ZoneInfo
 
+from dgmt.utils import jsonio
 from dgmt.utils.fluent import FluentBuilder
 from dgmt.utils.paths import expand_path, get_config_file, get_log_file
 
+# Parsed config.json contents keyed by (path, st_mtime_ns, st_size). Repeated
+# loads of an unchanged file (CLI helpers, daemon hot reload) become a dict
+# lookup instead of a full JSON parse. Callers receive a deep copy so the
+# cached dict is never mutated through _from_dict.
+_CONFIG_CACHE: dict[tuple[str, int, int], dict[str, Any]] = {}
 
-@dataclass
+T = TypeVar("T")
+
+# Config instances handed out by load_config(), keyed by path and validated
+# against the file's (st_mtime_ns, st_size). Commands that call
+# load_config() several times share one object; save() drops the entry.
+_LOADED_CONFIGS: dict[str, tuple[tuple[int, int], Config]] = {}
+
+
+@dataclass(slots=True)
 class HubConfig:
     """Configuration for the hub (local) machine."""
 
@@ -22,9 +40,10 @@ class HubConfig:
     health_check_interval: int = 60
     pull_on_startup: bool = True
     startup_pull_timeout: int = 120
+    parallel_paths: int = 4
 
 
-@dataclass
+@dataclass(slots=True)
 class SpokeConfig:
     """Configuration for a spoke (remote) machine."""
 
@@ -35,15 +54,21 @@ class SpokeConfig:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class BackendSettings:
     """Settings for sync backends."""
 
     # rclone settings
     rclone_remote: str = "dgmt"
     rclone_dest: str = "Obsidian-Backup"
-    rclone_flags: list[str] = field(default_factory=lambda: ["--verbose"])
+    rclone_flags: list[str] = field(default_factory=list)
     rclone_enabled: bool = False
+    rclone_transfers: int = 16
+    rclone_checkers: int = 32
+    rclone_fast_list: bool = True
+    rclone_drive_chunk_size: Optional[str] = "128M"
+    rclone_multi_thread_streams: int = 8
+    rclone_use_rcd: bool = True
 
     # Syncthing settings
     syncthing_api: str = "http://localhost:8384"
@@ -53,7 +78,7 @@ class BackendSettings:
     restart_syncthing_on_failure: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     """Logging configuration."""
 
@@ -61,7 +86,7 @@ class LoggingConfig:
     level: str = "INFO"
 
 
-@dataclass
+@dataclass(slots=True)
 class CalendarConfig:
     """Google Calendar configuration."""
 
@@ -71,7 +96,7 @@ class CalendarConfig:
     color_rules: list[dict] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class CanvasConfig:
     """Canvas LMS .ics feed configuration."""
 
@@ -89,7 +114,7 @@ class CanvasConfig:
     ])
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigData:
     """Complete configuration data structure."""
 
@@ -103,6 +128,84 @@ class ConfigData:
     canvas: CanvasConfig = field(default_factory=CanvasConfig)
 
 
+# config.json keys of each "backends" section -> BackendSettings attribute.
+_BACKEND_KEYS: dict[str, dict[str, str]] = {
+    "rclone": {
+        "remote": "rclone_remote",
+        "dest": "rclone_dest",
+        "flags": "rclone_flags",
+        "enabled": "rclone_enabled",
+        "transfers": "rclone_transfers",
+        "checkers": "rclone_checkers",
+        "fast_list": "rclone_fast_list",
+        "drive_chunk_size": "rclone_drive_chunk_size",
+        "multi_thread_streams": "rclone_multi_thread_streams",
+        "use_rcd": "rclone_use_rcd",
+    },
+    "syncthing": {
+        "api": "syncthing_api",
+        "api_key": "syncthing_api_key",
+        "exe": "syncthing_exe",
+        "stop_on_exit": "stop_syncthing_on_exit",
+        "restart_on_failure": "restart_syncthing_on_failure",
+    },
+}
+
+# BackendSettings attributes read from the legacy flat config format.
+_LEGACY_BACKEND_KEYS = (
+    "rclone_remote",
+    "rclone_dest",
+    "rclone_flags",
+    "syncthing_api",
+    "syncthing_api_key",
+    "syncthing_exe",
+    "restart_syncthing_on_failure",
+)
+
+
+# Legacy flat config keys -> LoggingConfig field.
+_LEGACY_LOGGING_KEYS = {"log_file": "file", "log_level": "level"}
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Get the field names of a config dataclass, in declaration order."""
+    return tuple(f.name for f in fields(cls))
+
+
+def _expand_all(paths: list[str]) -> list[Path]:
+    return [expand_path(p) for p in paths]
+
+
+def _decode_section(cls: type[T], raw: dict[str, Any], **converters: Callable[[Any], Any]) -> T:
+    """
+    Build a config dataclass from its JSON section in one constructor call.
+
+    Keys matching a field name are used (passed through the converter of
+    the same name, if any); missing keys keep the dataclass default and
+    unknown keys are ignored.
+    """
+    kwargs = {name: raw[name] for name in _field_names(cls) if name in raw}
+    for name, convert in converters.items():
+        if name in kwargs:
+            kwargs[name] = convert(kwargs[name])
+    return cls(**kwargs)
+
+
+def _encode_section(
+    obj: Any, exclude: tuple[str, ...] = (), **converters: Callable[[Any], Any]
+) -> dict[str, Any]:
+    """Convert a config dataclass back to its JSON section."""
+    section = {}
+    for name in _field_names(type(obj)):
+        if name in exclude:
+            continue
+        value = getattr(obj, name)
+        convert = converters.get(name)
+        section[name] = convert(value) if convert is not None else value
+    return section
+
+
 class Config(FluentBuilder["Config"]):
     """
     Fluent configuration builder for dgmt.
@@ -124,16 +227,28 @@ class Config(FluentBuilder["Config"]):
         self._config_path = config_path or get_config_file()
         self._data = ConfigData()
         self._load_existing()
+        # Mirrors hub.watch_paths for O(1) duplicate checks; the list keeps
+        # the order. Kept in sync by watch()/unwatch().
+        self._watch_set: set[Path] = set(self._data.hub.watch_paths)
 
     def _load_existing(self) -> None:
         """Load existing config if present."""
-        if self._config_path.exists():
-            try:
-                with open(self._config_path) as f:
-                    data = json.load(f)
-                self._from_dict(data)
-            except (json.JSONDecodeError, KeyError):
-                pass
+        try:
+            st = self._config_path.stat()
+        except OSError:
+            return
+
+        key = (str(self._config_path), st.st_mtime_ns, st.st_size)
+        try:
+            data = _CONFIG_CACHE.get(key)
+            if data is None:
+                data = jsonio.loads(self._config_path.read_bytes())
+                for stale in [k for k in _CONFIG_CACHE if k[0] == key[0]]:
+                    del _CONFIG_CACHE[stale]
+                _CONFIG_CACHE[key] = data
+            self._from_dict(copy.deepcopy(data))
+        except (json.JSONDecodeError, KeyError):
+            pass
 
     def _from_dict(self, data: dict[str, Any]) -> None:
         """Populate config from dictionary (for loading from JSON)."""
@@ -142,25 +257,10 @@ class Config(FluentBuilder["Config"]):
 
         # Hub config
         if "hub" in data:
-            hub = data["hub"]
-            self._data.hub.watch_paths = [
-                expand_path(p) for p in hub.get("watch_paths", [])
-            ]
-            self._data.hub.debounce_seconds = hub.get("debounce_seconds", 30)
-            self._data.hub.max_wait_seconds = hub.get("max_wait_seconds", 300)
-            self._data.hub.health_check_interval = hub.get("health_check_interval", 60)
-            self._data.hub.pull_on_startup = hub.get("pull_on_startup", True)
-            self._data.hub.startup_pull_timeout = hub.get("startup_pull_timeout", 120)
+            self._data.hub = _decode_section(HubConfig, data["hub"], watch_paths=_expand_all)
         elif "watch_paths" in data:
             # Legacy flat config format
-            self._data.hub.watch_paths = [
-                expand_path(p) for p in data.get("watch_paths", [])
-            ]
-            self._data.hub.debounce_seconds = data.get("debounce_seconds", 30)
-            self._data.hub.max_wait_seconds = data.get("max_wait_seconds", 300)
-            self._data.hub.health_check_interval = data.get("health_check_interval", 60)
-            self._data.hub.pull_on_startup = data.get("pull_on_startup", True)
-            self._data.hub.startup_pull_timeout = data.get("startup_pull_timeout", 120)
+            self._data.hub = _decode_section(HubConfig, data, watch_paths=_expand_all)
 
         # Defaults
         if "defaults" in data:
@@ -169,148 +269,62 @@ class Config(FluentBuilder["Config"]):
         # Spokes
         if "spokes" in data:
             for name, spoke_data in data["spokes"].items():
-                self._data.spokes[name] = SpokeConfig(
-                    name=name,
-                    backend=spoke_data.get("backend", "syncthing"),
-                    remote_path=spoke_data.get("remote_path"),
-                    device_id=spoke_data.get("device_id"),
-                    enabled=spoke_data.get("enabled", True),
+                self._data.spokes[name] = _decode_section(
+                    SpokeConfig, {**spoke_data, "name": name}
                 )
 
         # Backend settings
+        backends = self._data.backends
         if "backends" in data:
-            backends = data["backends"]
-            if "rclone" in backends:
-                rc = backends["rclone"]
-                self._data.backends.rclone_remote = rc.get("remote", "dgmt")
-                self._data.backends.rclone_dest = rc.get("dest", "Obsidian-Backup")
-                self._data.backends.rclone_flags = rc.get("flags", ["--verbose"])
-                self._data.backends.rclone_enabled = rc.get("enabled", False)
-            if "syncthing" in backends:
-                st = backends["syncthing"]
-                self._data.backends.syncthing_api = st.get("api", "http://localhost:8384")
-                self._data.backends.syncthing_api_key = st.get("api_key")
-                exe = st.get("exe")
-                self._data.backends.syncthing_exe = str(expand_path(exe)) if exe else None
-                self._data.backends.stop_syncthing_on_exit = st.get(
-                    "stop_on_exit", True
-                )
-                self._data.backends.restart_syncthing_on_failure = st.get(
-                    "restart_on_failure", True
-                )
+            for section, keys in _BACKEND_KEYS.items():
+                raw = data["backends"].get(section, {})
+                for key, attr in keys.items():
+                    if key in raw:
+                        setattr(backends, attr, raw[key])
+            exe = backends.syncthing_exe
+            backends.syncthing_exe = str(expand_path(exe)) if exe else None
         elif "rclone_remote" in data:
-            # Legacy flat config format
-            self._data.backends.rclone_remote = data.get("rclone_remote", "dgmt")
-            self._data.backends.rclone_dest = data.get("rclone_dest", "Obsidian-Backup")
-            self._data.backends.rclone_flags = data.get("rclone_flags", ["--verbose"])
-            self._data.backends.syncthing_api = data.get(
-                "syncthing_api", "http://localhost:8384"
-            )
-            self._data.backends.syncthing_api_key = data.get("syncthing_api_key")
-            self._data.backends.syncthing_exe = data.get("syncthing_exe")
-            self._data.backends.restart_syncthing_on_failure = data.get(
-                "restart_syncthing_on_failure", True
-            )
+            # Legacy flat config format (keys match the attribute names)
+            for attr in _LEGACY_BACKEND_KEYS:
+                if attr in data:
+                    setattr(backends, attr, data[attr])
 
         # Logging
         if "logging" in data:
-            log = data["logging"]
-            self._data.logging.file = expand_path(log.get("file", "~/.dgmt/dgmt.log"))
-            self._data.logging.level = log.get("level", "INFO")
+            self._data.logging = _decode_section(LoggingConfig, data["logging"], file=expand_path)
         elif "log_file" in data:
             # Legacy flat config format
-            self._data.logging.file = expand_path(data.get("log_file", "~/.dgmt/dgmt.log"))
-            self._data.logging.level = data.get("log_level", "INFO")
+            legacy = {attr: data[key] for key, attr in _LEGACY_LOGGING_KEYS.items() if key in data}
+            self._data.logging = _decode_section(LoggingConfig, legacy, file=expand_path)
 
         # Calendar
         if "calendar" in data:
-            cal = data["calendar"]
-            self._data.calendar.enabled = cal.get("enabled", False)
-            self._data.calendar.default_calendar_id = cal.get(
-                "default_calendar_id", "primary"
-            )
-            self._data.calendar.default_view = cal.get("default_view", "weekly")
-            self._data.calendar.color_rules = cal.get("color_rules", [])
+            self._data.calendar = _decode_section(CalendarConfig, data["calendar"])
 
         # Canvas
         if "canvas" in data:
-            cv = data["canvas"]
-            self._data.canvas.enabled = cv.get("enabled", False)
-            self._data.canvas.ics_url_file = cv.get(
-                "ics_url_file", "~/.dgmt/secrets/canvas_ics_url"
-            )
-            self._data.canvas.fetch_interval_seconds = cv.get("fetch_interval_seconds", 900)
-            self._data.canvas.cache_file = cv.get(
-                "cache_file", "~/.dgmt/cache/canvas_assignments.json"
-            )
-            self._data.canvas.completion_file = cv.get(
-                "completion_file", "~/.dgmt/state/canvas_completed.json"
-            )
-            self._data.canvas.lookahead_days = cv.get("lookahead_days", 30)
-            self._data.canvas.course_aliases = cv.get("course_aliases", {})
-            self._data.canvas.assignment_keywords = cv.get("assignment_keywords", [
-                "assignment", "homework", "hw", "quiz", "exam", "test",
-                "project", "lab", "midterm", "final", "paper", "essay",
-                "discussion", "presentation", "report", "problem set", "ps",
-            ])
+            self._data.canvas = _decode_section(CanvasConfig, data["canvas"])
 
     def _to_dict(self) -> dict[str, Any]:
         """Convert config to dictionary for JSON serialization."""
+        backends = self._data.backends
         return {
             "timezone": self._data.timezone,
-            "hub": {
-                "watch_paths": [str(p) for p in self._data.hub.watch_paths],
-                "debounce_seconds": self._data.hub.debounce_seconds,
-                "max_wait_seconds": self._data.hub.max_wait_seconds,
-                "health_check_interval": self._data.hub.health_check_interval,
-                "pull_on_startup": self._data.hub.pull_on_startup,
-                "startup_pull_timeout": self._data.hub.startup_pull_timeout,
-            },
+            "hub": _encode_section(
+                self._data.hub, watch_paths=lambda paths: [str(p) for p in paths]
+            ),
             "defaults": self._data.defaults,
             "spokes": {
-                name: {
-                    "backend": spoke.backend,
-                    "remote_path": spoke.remote_path,
-                    "device_id": spoke.device_id,
-                    "enabled": spoke.enabled,
-                }
+                name: _encode_section(spoke, exclude=("name",))
                 for name, spoke in self._data.spokes.items()
             },
             "backends": {
-                "rclone": {
-                    "remote": self._data.backends.rclone_remote,
-                    "dest": self._data.backends.rclone_dest,
-                    "flags": self._data.backends.rclone_flags,
-                    "enabled": self._data.backends.rclone_enabled,
-                },
-                "syncthing": {
-                    "api": self._data.backends.syncthing_api,
-                    "api_key": self._data.backends.syncthing_api_key,
-                    "exe": self._data.backends.syncthing_exe,
-                    "stop_on_exit": self._data.backends.stop_syncthing_on_exit,
-                    "restart_on_failure": self._data.backends.restart_syncthing_on_failure,
-                },
-            },
-            "logging": {
-                "file": str(self._data.logging.file),
-                "level": self._data.logging.level,
-            },
-            "calendar": {
-                "enabled": self._data.calendar.enabled,
-                "default_calendar_id": self._data.calendar.default_calendar_id,
-                "default_view": self._data.calendar.default_view,
-                "color_rules": self._data.calendar.color_rules,
-            },
-            "canvas": {
-                "enabled": self._data.canvas.enabled,
-                "ics_url_file": self._data.canvas.ics_url_file,
-                "fetch_interval_seconds": self._data.canvas.fetch_interval_seconds,
-                "cache_file": self._data.canvas.cache_file,
-                "completion_file": self._data.canvas.completion_file,
-                "lookahead_days": self._data.canvas.lookahead_days,
-                "course_aliases": self._data.canvas.course_aliases,
-                "assignment_keywords": self._data.canvas.assignment_keywords,
+                section: {key: getattr(backends, attr) for key, attr in keys.items()}
+                for section, keys in _BACKEND_KEYS.items()
             },
+            "logging": _encode_section(self._data.logging, file=str),
+            "calendar": _encode_section(self._data.calendar),
+            "canvas": _encode_section(self._data.canvas),
         }
 
     # Fluent builder methods
@@ -320,10 +334,21 @@ class Config(FluentBuilder["Config"]):
         self._check_not_built()
         for path in paths:
             expanded = expand_path(path)
-            if expanded not in self._data.hub.watch_paths:
+            if expanded not in self._watch_set:
+                self._watch_set.add(expanded)
                 self._data.hub.watch_paths.append(expanded)
         return self
 
+    def unwatch(self, *paths: str) -> Config:
+        """Stop watching paths (paths not being watched are ignored)."""
+        self._check_not_built()
+        for path in paths:
+            expanded = expand_path(path)
+            if expanded in self._watch_set:
+                self._watch_set.discard(expanded)
+                self._data.hub.watch_paths.remove(expanded)
+        return self
+
     def with_backend(self, backend: str) -> Config:
         """Set the default sync backend."""
         self._check_not_built()
@@ -422,8 +447,25 @@ class Config(FluentBuilder["Config"]):
     def save(self) -> Config:
         """Save configuration to file."""
         self._config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self._config_path, "w") as f:
-            json.dump(self._to_dict(), f, indent=2)
+        # Write a sibling file and rename it into place, so a crash or a
+        # reload triggered mid-write never sees a partial config. The file
+        # holds API keys: keep the existing file's mode, or owner-only for a
+        # new one.
+        try:
+            mode = stat.S_IMODE(os.stat(self._config_path).st_mode)
+        except FileNotFoundError:
+            mode = 0o600
+        tmp_path = self._config_path.with_suffix(self._config_path.suffix + ".tmp")
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(fd, "wb") as f:
+                f.write(jsonio.dumps(self._to_dict()))
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, self._config_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        _LOADED_CONFIGS.pop(str(self._config_path), None)
         return self
 
     def build(self) -> ConfigData:
@@ -438,6 +480,10 @@ class Config(FluentBuilder["Config"]):
 
     # Convenience methods
 
+    def is_watching(self, path: str) -> bool:
+        """Check whether a path is in the watch list."""
+        return expand_path(path) in self._watch_set
+
     def get_spoke(self, name: str) -> Optional[SpokeConfig]:
         """Get a spoke configuration by name."""
         return self._data.spokes.get(name)
@@ -451,8 +497,27 @@ class Config(FluentBuilder["Config"]):
 
 
 def load_config(config_path: Optional[Path] = None) -> Config:
-    """Load configuration from file."""
-    return Config(config_path)
+    """
+    Load configuration from file.
+
+    Returns the same Config object for as long as the file is unchanged, so
+    callers within one process don't each rebuild it. Use Config() directly
+    for a private instance that will be modified without being saved.
+    """
+    path = config_path or get_config_file()
+    try:
+        st = path.stat()
+    except OSError:
+        return Config(path)
+
+    stamp = (st.st_mtime_ns, st.st_size)
+    entry = _LOADED_CONFIGS.get(str(path))
+    if entry is not None and entry[0] == stamp and not entry[1]._built:
+        return entry[1]
+
+    config = Config(path)
+    _LOADED_CONFIGS[str(path)] = (stamp, config)
+    return config
 
 
 def init_config(config_path: Optional[Path] = None) -> Config:
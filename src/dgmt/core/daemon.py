@@ -2,45 +2,101 @@
 
 from __future__ import annotations
 
+import os
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
 
-from dgmt.backends import get_backend
-from dgmt.backends.base import Backend
-from dgmt.core.config import Config, ConfigData
+from dgmt.core.config import BackendSettings, Config, ConfigData
 from dgmt.core.shutdown import ShutdownHandler, kill_syncthing
 from dgmt.core.watcher import ChangeSet, DebouncedWatcher
 from dgmt.utils.logging import setup_logging, get_logger
 from dgmt.utils.paths import get_config_file
 
+if TYPE_CHECKING:
+    from watchdog.observers import Observer
+
+    from dgmt.backends.base import Backend
+
+# Upper bound (seconds) for the backed-off Syncthing health check interval
+HEALTH_CHECK_MAX_INTERVAL = 600
+
+
+def _file_stamp(path: Path) -> Optional[tuple[int, int]]:
+    """Get (st_mtime_ns, st_size) for a file, or None if it can't be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _syncthing_key(settings: BackendSettings) -> tuple[str, Optional[str], Optional[str]]:
+    """The settings a Syncthing backend instance is built from."""
+    return (settings.syncthing_api, settings.syncthing_api_key, settings.syncthing_exe)
+
 
 class ConfigFileHandler(FileSystemEventHandler):
     """Watches config file for changes and triggers reload."""
 
+    # Quiet period after the last event before reloading; editors often
+    # write several times per save
+    DEBOUNCE_SECONDS = 0.5
+
     def __init__(self, config_path: Path, reload_callback) -> None:
         self._config_path = config_path
+        # Matched with endswith() so irrelevant events never build a Path
+        self._target_suffix = os.sep + config_path.name
         self._reload_callback = reload_callback
-        self._debounce_timer: Optional[threading.Timer] = None
-        self._lock = threading.Lock()
+        # Monotonic time the reload is due; pushed back by every event
+        self._deadline = 0.0
+        self._wake = threading.Event()
+        self._stopped = False
+        # One long-lived worker instead of a Timer thread per event
+        self._worker = threading.Thread(
+            target=self._run, daemon=True, name="config-reload"
+        )
+        self._worker.start()
 
     def on_modified(self, event: FileSystemEvent) -> None:
-        if event.is_directory:
+        if event.is_directory or not event.src_path.endswith(self._target_suffix):
             return
-        if Path(event.src_path).name != self._config_path.name:
+        self._schedule()
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        # Config.save (and many editors) write a temp file and rename it over
+        # the config, which arrives as a move rather than a modification
+        if event.is_directory or not event.dest_path.endswith(self._target_suffix):
             return
+        self._schedule()
+
+    def _schedule(self) -> None:
+        """Push the reload deadline back and wake the worker."""
+        self._deadline = time.monotonic() + self.DEBOUNCE_SECONDS
+        self._wake.set()
+
+    def _run(self) -> None:
+        """Fire the reload callback once events have been quiet long enough."""
+        fired = 0.0
+        while not self._stopped:
+            deadline = self._deadline
+            timeout = None if deadline <= fired else max(0.0, deadline - time.monotonic())
+            if self._wake.wait(timeout):
+                self._wake.clear()
+                continue
+            # Only fire if no event moved the deadline while we slept
+            if self._deadline == deadline and not self._stopped:
+                fired = deadline
+                self._reload_callback()
 
-        # Debounce rapid saves (editors often write multiple times)
-        with self._lock:
-            if self._debounce_timer:
-                self._debounce_timer.cancel()
-            self._debounce_timer = threading.Timer(0.5, self._reload_callback)
-            self._debounce_timer.daemon = True
-            self._debounce_timer.start()
+    def stop(self) -> None:
+        """Stop the worker thread."""
+        self._stopped = True
+        self._wake.set()
 
 
 class Daemon:
@@ -61,17 +117,32 @@ class Daemon:
         """
         self._config_obj = config or Config()
         self._config: ConfigData = self._config_obj.data
+        # String forms of hub.watch_paths, as passed to the backends;
+        # rebuilt whenever the config is replaced
+        self._watch_path_strs: list[str] = [str(p) for p in self._config.hub.watch_paths]
         self._logger = setup_logging(
             log_file=self._config.logging.file,
             level=self._config.logging.level,
         )
         self._backends: dict[str, Backend] = {}
+        # Settings and watch paths the current backends were built for
+        self._backends_built_for: Optional[tuple[BackendSettings, tuple[Path, ...]]] = None
         self._watcher: Optional[DebouncedWatcher] = None
         self._config_observer: Optional[Observer] = None
+        self._config_handler: Optional[ConfigFileHandler] = None
         self._shutdown = ShutdownHandler()
         self._running = False
+        # Set on shutdown so background loops wake immediately instead of
+        # finishing their sleep
+        self._stop_event = threading.Event()
         self._health_thread: Optional[threading.Thread] = None
         self._reload_lock = threading.Lock()
+        # (mtime_ns, size) of the config file as of the last successful load
+        self._config_stamp: Optional[tuple[int, int]] = None
+        # rclone runs are network/subprocess bound, so paths sync in
+        # parallel. Created on first use; see _get_pool().
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
 
     def _start_config_watcher(self) -> None:
         """Start watching the config file for changes."""
@@ -79,7 +150,12 @@ class Daemon:
         if not config_path.exists():
             return
 
-        handler = ConfigFileHandler(config_path, self._reload_config)
+        self._config_stamp = _file_stamp(config_path)
+        # The observer picks a platform backend (inotify, FSEvents, ...) on
+        # import, so it is only loaded once a daemon actually starts
+        from watchdog.observers import Observer
+
+        handler = self._config_handler = ConfigFileHandler(config_path, self._reload_config)
         self._config_observer = Observer()
         self._config_observer.schedule(handler, str(config_path.parent), recursive=False)
         self._config_observer.start()
@@ -88,16 +164,33 @@ class Daemon:
     def _reload_config(self) -> None:
         """Reload configuration from disk and apply changes."""
         with self._reload_lock:
+            # Events that didn't actually change the file (attribute
+            # changes, a burst already handled) skip the reload entirely
+            stamp = _file_stamp(get_config_file())
+            if stamp is not None and stamp == self._config_stamp:
+                self._logger.debug("Config file unchanged on disk, skipping reload")
+                return
+
             self._logger.info("Config file changed, reloading...")
 
             try:
                 new_config = Config()
+
+                # Saves that rewrite identical content (editors, touch)
+                # don't need the watcher/backend restart below
+                if new_config.data == self._config:
+                    self._config_stamp = stamp
+                    self._logger.info("Config content unchanged, nothing to reload")
+                    return
+
+                old_backends = self._config.backends
                 old_watch_paths = set(self._config.hub.watch_paths)
                 new_watch_paths = set(new_config.data.hub.watch_paths)
 
                 # Update config references
                 self._config_obj = new_config
                 self._config = new_config.data
+                self._watch_path_strs = [str(p) for p in self._config.hub.watch_paths]
 
                 # Handle watch path changes
                 added = new_watch_paths - old_watch_paths
@@ -116,9 +209,18 @@ class Daemon:
                     self._watcher.watch_all(self._config.hub.watch_paths)
                     self._watcher.start()
 
-                # Reinitialize backends if settings changed
-                self._init_backends()
+                    # Resize the sync pool for the new path count on next use
+                    with self._pool_lock:
+                        pool, self._pool = self._pool, None
+                    if pool is not None:
+                        pool.shutdown(wait=False)
 
+                # Reinitialize backends only if their settings (or the paths
+                # rclone prepares) changed
+                if self._config.backends != old_backends or added or removed:
+                    self._init_backends(previous=old_backends)
+
+                self._config_stamp = stamp
                 self._logger.info("Config reloaded successfully")
 
                 # Push updated config to spokes in background
@@ -144,16 +246,35 @@ class Daemon:
         t = threading.Thread(target=_do_push, daemon=True, name="config-push")
         t.start()
 
-    def _init_backends(self) -> None:
-        """Initialize sync backends based on configuration."""
+    def _init_backends(self, previous: Optional[BackendSettings] = None) -> None:
+        """
+        Initialize sync backends based on configuration.
+
+        Args:
+            previous: Backend settings in effect before a reload. The running
+                Syncthing backend is kept if its connection settings match.
+        """
+        from dgmt.backends import BackendRegistry, get_backend
+
+        settings = self._config.backends
+        built_for = (settings, tuple(self._config.hub.watch_paths))
+        if built_for == self._backends_built_for:
+            return
+
         # Syncthing backend (for local device health monitoring)
-        syncthing = get_backend(
-            "syncthing",
-            api_url=self._config.backends.syncthing_api,
-            api_key=self._config.backends.syncthing_api_key,
-            exe_path=self._config.backends.syncthing_exe,
-        )
-        self._backends["syncthing"] = syncthing
+        if (
+            previous is None
+            or "syncthing" not in self._backends
+            or _syncthing_key(previous) != _syncthing_key(settings)
+        ):
+            self._backends["syncthing"] = get_backend(
+                "syncthing",
+                api_url=settings.syncthing_api,
+                api_key=settings.syncthing_api_key,
+                exe_path=settings.syncthing_exe,
+            )
+
+        old_rclone = self._backends.pop("rclone", None)
 
         # rclone backend (if enabled)
         if self._config.backends.rclone_enabled:
@@ -162,9 +283,35 @@ class Daemon:
                 remote=self._config.backends.rclone_remote,
                 dest=self._config.backends.rclone_dest,
                 flags=self._config.backends.rclone_flags,
+                transfers=self._config.backends.rclone_transfers,
+                checkers=self._config.backends.rclone_checkers,
+                fast_list=self._config.backends.rclone_fast_list,
+                drive_chunk_size=self._config.backends.rclone_drive_chunk_size,
+                multi_thread_streams=self._config.backends.rclone_multi_thread_streams,
+                use_rcd=self._config.backends.rclone_use_rcd,
             )
+            rclone.prepare(self._config.hub.watch_paths)
             self._backends["rclone"] = rclone
 
+        # Release the previous rclone backend's rc daemon on reload, unless
+        # the registry handed back the same shared instance
+        if old_rclone is not None and old_rclone is not self._backends.get("rclone"):
+            old_rclone.close()
+            BackendRegistry.discard(old_rclone)
+
+        self._backends_built_for = built_for
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Get the per-path sync pool, creating it on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                workers = min(max(1, self._config.hub.parallel_paths), 8)
+                workers = min(workers, max(1, len(self._config.hub.watch_paths)))
+                self._pool = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="rclone-sync"
+                )
+            return self._pool
+
     def _sync_all(self, changes: Optional[ChangeSet] = None) -> None:
         """Sync all watched paths using rclone (if enabled)."""
         rclone = self._backends.get("rclone")
@@ -184,9 +331,13 @@ class Daemon:
         if changes and changes.renamed:
             self._apply_renames(changes.renamed)
 
-        for path in self._config.hub.watch_paths:
+        pool = self._get_pool()
+        futures = [
+            (path, pool.submit(rclone.sync, path)) for path in self._watch_path_strs
+        ]
+        for path, future in futures:
             try:
-                rclone.sync(str(path))
+                future.result()
             except Exception as e:
                 self._logger.error(f"Sync failed for {path}: {e}")
 
@@ -196,18 +347,24 @@ class Daemon:
         if not rclone:
             return
 
+        # Group renames by the watch path they belong to, so each group is
+        # applied as one batch
+        batches: dict[str, list[tuple[str, str]]] = {}
         for old_path, new_path in renames.items():
-            # Find which watch path this rename belongs to
             old_p = Path(old_path)
-            for watch_path in self._config.hub.watch_paths:
+            for watch_path, watch_str in zip(self._config.hub.watch_paths, self._watch_path_strs):
                 try:
                     old_p.relative_to(watch_path)
-                    # This rename belongs to this watch path
-                    if rclone.rename(str(watch_path), old_path, new_path):
-                        self._logger.info(f"Remote rename: {old_path} -> {new_path}")
-                    break
                 except ValueError:
                     continue
+                batches.setdefault(watch_str, []).append((old_path, new_path))
+                break
+
+        for watch_path, pairs in batches.items():
+            results = rclone.rename_many(watch_path, pairs)
+            for old_path, new_path in pairs:
+                if results.get(old_path):
+                    self._logger.info(f"Remote rename: {old_path} -> {new_path}")
 
     def _pull_all(self) -> None:
         """Pull all watched paths from remote."""
@@ -225,9 +382,14 @@ class Daemon:
                     self._logger.warning("Syncthing still busy, proceeding with rclone pull anyway")
 
         timeout = self._config.hub.startup_pull_timeout
-        for path in self._config.hub.watch_paths:
+        pool = self._get_pool()
+        futures = [
+            (path, pool.submit(rclone.pull, path, timeout=timeout))
+            for path in self._watch_path_strs
+        ]
+        for path, future in futures:
             try:
-                rclone.pull(str(path), timeout=timeout)
+                future.result()
             except Exception as e:
                 self._logger.error(f"Pull failed for {path}: {e}")
 
@@ -246,25 +408,38 @@ class Daemon:
                 else:
                     self._logger.error("Failed to start Syncthing")
 
-        while self._running:
-            time.sleep(self._config.hub.health_check_interval)
-
-            if not self._running:
+        # Back off while Syncthing stays healthy: each consecutive healthy
+        # probe doubles the interval (up to 16x, capped at 10 minutes), and
+        # any failure drops straight back to the configured interval.
+        healthy_streak = 0
+        while True:
+            base = self._config.hub.health_check_interval
+            interval = min(base * (2 ** min(healthy_streak, 4)), HEALTH_CHECK_MAX_INTERVAL)
+            if self._stop_event.wait(max(base, interval)):
                 break
 
+            # A config reload may have replaced the backend
+            syncthing = self._backends.get("syncthing")
+            if syncthing is None:
+                continue
+
             if self._config.backends.restart_syncthing_on_failure:
-                if not syncthing.is_healthy():
-                    self._logger.warning("Syncthing not responding!")
-                    if syncthing.restart():
-                        self._logger.info("Syncthing restarted successfully")
-                    else:
-                        self._logger.error("Failed to restart Syncthing")
+                if syncthing.is_healthy():
+                    healthy_streak += 1
+                    continue
+
+                healthy_streak = 0
+                self._logger.warning("Syncthing not responding!")
+                if syncthing.restart():
+                    self._logger.info("Syncthing restarted successfully")
+                else:
+                    self._logger.error("Failed to restart Syncthing")
 
     def start(self) -> None:
         """Start the daemon (blocking)."""
         self._logger.info("=" * 60)
         self._logger.info("dgmt starting up")
-        self._logger.info(f"Watching: {[str(p) for p in self._config.hub.watch_paths]}")
+        self._logger.info(f"Watching: {self._watch_path_strs}")
         if self._config.backends.rclone_enabled:
             self._logger.info(
                 f"rclone: {self._config.backends.rclone_remote}:"
@@ -273,6 +448,7 @@ class Daemon:
         self._logger.info("=" * 60)
 
         self._running = True
+        self._stop_event.clear()
 
         # Initialize backends
         self._init_backends()
@@ -329,10 +505,13 @@ class Daemon:
         """Internal stop method called by shutdown handler."""
         self._logger.info("Shutting down...")
         self._running = False
+        self._stop_event.set()
 
         if self._config_observer:
             self._config_observer.stop()
             self._config_observer.join(timeout=2)
+        if self._config_handler:
+            self._config_handler.stop()
 
         if self._watcher:
             self._watcher.stop()
@@ -340,6 +519,19 @@ class Daemon:
         if self._health_thread and self._health_thread.is_alive():
             self._health_thread.join(timeout=2)
 
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        rclone = self._backends.pop("rclone", None)
+        if rclone is not None:
+            from dgmt.backends import BackendRegistry
+
+            rclone.close()
+            BackendRegistry.discard(rclone)
+        self._backends_built_for = None
+
         self._logger.info("dgmt stopped")
 
     def stop(self) -> None:
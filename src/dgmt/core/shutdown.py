@@ -10,6 +10,7 @@ import threading
 from typing import Callable, Optional
 
 from dgmt.utils.logging import get_logger
+from dgmt.utils.proc import SUBPROCESS_ARGS
 
 
 class ShutdownHandler:
@@ -142,14 +143,10 @@ def kill_syncthing(config: dict) -> None:
 
     if sys.platform == "win32":
         try:
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = 0
             subprocess.run(
                 ["taskkill", "/f", "/im", "syncthing.exe"],
                 capture_output=True,
-                startupinfo=startupinfo,
-                creationflags=subprocess.CREATE_NO_WINDOW,
+                **SUBPROCESS_ARGS,
             )
         except Exception as e:
             logger.error(f"Failed to kill Syncthing: {e}")
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import os
 import re
 import threading
+import time
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
 from pathlib import Path
 from typing import Callable, Optional, Set
 
@@ -18,6 +20,7 @@ from watchdog.events import (
     FileMovedEvent,
 )
 from watchdog.observers import Observer
+from watchdog.observers.api import ObservedWatch
 
 from dgmt.utils.logging import get_logger
 
@@ -77,21 +80,57 @@ class DebouncedHandler(FileSystemEventHandler):
         self.debounce_seconds = debounce_seconds
         self.max_wait_seconds = max_wait_seconds
         self.ignore_patterns = ignore_patterns or self.DEFAULT_IGNORE
+        self._ignore_set = frozenset(self.ignore_patterns)
         self.logger = get_logger("dgmt.watcher")
 
-        self._last_event: Optional[datetime] = None
-        self._first_event: Optional[datetime] = None
-        self._timer: Optional[threading.Timer] = None
-        self._lock = threading.RLock()  # RLock allows reentrant acquisition (needed for max_wait path)
+        # Timestamps are integer nanoseconds from time.monotonic_ns()
+        self._debounce_ns = int(debounce_seconds * 1_000_000_000)
+        self._max_wait_ns = int(max_wait_seconds * 1_000_000_000)
+        self._first_event_ns: Optional[int] = None
+        self._deadline_ns: Optional[int] = None
         self._changes = ChangeSet()
+        # Current rename destination -> original path, for collapsing chains
+        self._rename_origins: dict[str, str] = {}
+
+        # The observer thread only appends (timestamp, event) to this deque
+        # (append/popleft are atomic) and pokes the worker. Everything else —
+        # the ChangeSet, timestamps, deadline — is owned by the single worker
+        # thread, so ingesting events takes no lock.
+        self._events: deque[tuple[int, Optional[FileSystemEvent]]] = deque()
+        self._wake = threading.Event()
+        self._cancel_requested = False
+        self._closed = False
+
+        # Editors fire many modify events per save. Repeats of a path already
+        # reported as modified in the current batch are queued as bare
+        # timestamps (they still extend the quiet period) and skip change
+        # tracking entirely. The set belongs to the observer thread; the worker only bumps the
+        # generation when it hands off a batch, which tells the observer to
+        # start a fresh set.
+        self._batch_generation = 0
+        self._seen_generation = 0
+        self._seen_modified: set[str] = set()
+
+        # Called (on the observer thread) with the path of each directory
+        # that appears, so the watcher can add watches for new subtrees
+        self.on_directory_added: Optional[Callable[[str], bool]] = None
+        # Likewise for each directory that is deleted or moved away
+        self.on_directory_removed: Optional[Callable[[str], None]] = None
+        self._worker = threading.Thread(
+            target=self._debounce_loop,
+            daemon=True,
+            name="debounce",
+        )
+        self._worker.start()
 
     def _should_ignore(self, path: str) -> bool:
         """Check if a path should be ignored."""
-        parts = Path(path).parts
-        for part in parts:
-            if part in self.ignore_patterns:
+        # Plain string ops: this runs for every event, so skip Path parsing
+        ignore = self._ignore_set
+        for part in path.replace("\\", "/").split("/"):
+            if part in ignore:
                 return True
-            if part.startswith(".") and part not in {".", ".."}:
+            if part[:1] == "." and part not in (".", ".."):
                 # Ignore hidden files/directories
                 return True
         return False
@@ -100,37 +139,32 @@ class DebouncedHandler(FileSystemEventHandler):
         """Handle any file system event."""
         try:
             if event.is_directory:
+                if event.event_type in ("deleted", "moved"):
+                    if self.on_directory_removed is not None:
+                        self.on_directory_removed(event.src_path)
+                if event.event_type not in ("created", "moved"):
+                    return
+                path = getattr(event, "dest_path", None) or event.src_path
+                if self._should_ignore(path) or self.on_directory_added is None:
+                    return
+                if not self.on_directory_added(path):
+                    return
+                # Files written before the new watch landed produced no
+                # events, so record the directory itself to schedule a sync
+                event = FileCreatedEvent(path)
+            elif self._should_ignore(event.src_path):
                 return
-            if self._should_ignore(event.src_path):
-                return
-
-            with self._lock:
-                now = datetime.now()
-                self._last_event = now
-
-                if self._first_event is None:
-                    self._first_event = now
-
-                # Track the specific change type
-                self._track_event(event)
-
-                # Cancel existing timer
-                if self._timer:
-                    self._timer.cancel()
-
-                # Check if we've exceeded max wait
-                elapsed = (now - self._first_event).total_seconds()
-                if elapsed >= self.max_wait_seconds:
-                    self.logger.info("Max wait exceeded, forcing sync")
-                    self._trigger_callback()
+            elif isinstance(event, FileModifiedEvent):
+                if self._seen_generation != self._batch_generation:
+                    self._seen_generation = self._batch_generation
+                    self._seen_modified.clear()
+                if event.src_path in self._seen_modified:
+                    event = None
                 else:
-                    # Schedule new debounced callback
-                    self._timer = threading.Timer(
-                        self.debounce_seconds,
-                        self._trigger_callback
-                    )
-                    self._timer.daemon = True
-                    self._timer.start()
+                    self._seen_modified.add(event.src_path)
+
+            self._events.append((time.monotonic_ns(), event))
+            self._wake.set()
         except Exception as e:
             self.logger.error(f"Error handling file event: {e}", exc_info=True)
 
@@ -140,6 +174,8 @@ class DebouncedHandler(FileSystemEventHandler):
 
     def _track_event(self, event: FileSystemEvent) -> None:
         """Track the specific type of file system event."""
+        # Runs once per event: debug logs use lazy %-formatting so nothing is
+        # built when DEBUG is off
         src = event.src_path
 
         if isinstance(event, FileMovedEvent):
@@ -148,26 +184,37 @@ class DebouncedHandler(FileSystemEventHandler):
             # The temp file never existed on the remote, so skip the rename and
             # treat the destination as a new file for bisync to pick up.
             if self._is_syncthing_temp(src):
-                self.logger.debug(f"Syncthing temp rename, treating as create: {dest}")
+                self.logger.debug("Syncthing temp rename, treating as create: %s", dest)
                 self._changes.created.add(dest)
                 return
-            self.logger.debug(f"Rename detected: {src} -> {dest}")
-            # Track as rename
-            self._changes.renamed[src] = dest
-            # If the source was previously created in this batch, update it
-            if src in self._changes.created:
-                self._changes.created.discard(src)
-                self._changes.created.add(dest)
+            self.logger.debug("Rename detected: %s -> %s", src, dest)
+            changes = self._changes
+            if src in changes.created:
+                # Created in this batch, so it can't be on the remote yet:
+                # no remote rename, bisync uploads it under the new name
+                changes.created.discard(src)
+                changes.created.add(dest)
+            else:
+                # Collapse chains (a -> b -> c becomes a -> c) so the remote
+                # sees one rename of the original path
+                origin = self._rename_origins.pop(src, src)
+                changes.renamed.pop(origin, None)
+                if origin != dest:
+                    changes.renamed[origin] = dest
+                    self._rename_origins[dest] = origin
+            if src in changes.modified:
+                changes.modified.discard(src)
+                changes.modified.add(dest)
             # Remove from deleted if dest was there
-            self._changes.deleted.discard(dest)
+            changes.deleted.discard(dest)
 
         elif isinstance(event, FileCreatedEvent):
             # Ignore Syncthing temp files entirely — they are incomplete downloads
             # that should never be pushed to remote
             if self._is_syncthing_temp(src):
-                self.logger.debug(f"Ignoring Syncthing temp create: {src}")
+                self.logger.debug("Ignoring Syncthing temp create: %s", src)
                 return
-            self.logger.debug(f"Create detected: {src}")
+            self.logger.debug("Create detected: %s", src)
             self._changes.created.add(src)
             # If it was deleted earlier in this batch, it's now modified
             if src in self._changes.deleted:
@@ -177,9 +224,9 @@ class DebouncedHandler(FileSystemEventHandler):
         elif isinstance(event, FileDeletedEvent):
             # Ignore Syncthing temp file deletions — they were never tracked
             if self._is_syncthing_temp(src):
-                self.logger.debug(f"Ignoring Syncthing temp delete: {src}")
+                self.logger.debug("Ignoring Syncthing temp delete: %s", src)
                 return
-            self.logger.debug(f"Delete detected: {src}")
+            self.logger.debug("Delete detected: %s", src)
             # If it was created in this batch, just remove the create
             if src in self._changes.created:
                 self._changes.created.discard(src)
@@ -191,25 +238,71 @@ class DebouncedHandler(FileSystemEventHandler):
             # Ignore Syncthing temp file modifications — incomplete download chunks
             if self._is_syncthing_temp(src):
                 return
-            self.logger.debug(f"Modify detected: {src}")
+            self.logger.debug("Modify detected: %s", src)
             # Only track if not already tracked as created
             if src not in self._changes.created:
                 self._changes.modified.add(src)
 
+    def _drain_events(self) -> None:
+        """Fold queued events into the ChangeSet and move the deadline."""
+        last_event_ns: Optional[int] = None
+        events = self._events
+        while events:
+            event_ns, event = events.popleft()
+            if self._first_event_ns is None:
+                self._first_event_ns = event_ns
+            last_event_ns = event_ns
+            if event is None:
+                continue
+            try:
+                self._track_event(event)
+            except Exception as e:
+                self.logger.error(f"Error handling file event: {e}", exc_info=True)
+
+        if last_event_ns is not None:
+            # Restart the quiet period, but never past the max wait
+            self._deadline_ns = min(
+                last_event_ns + self._debounce_ns,
+                self._first_event_ns + self._max_wait_ns,
+            )
+
+    def _debounce_loop(self) -> None:
+        """Worker loop: drain events, sleep until the deadline, then fire."""
+        timeout: Optional[float] = None
+        while True:
+            self._wake.wait(timeout)
+            self._wake.clear()
+            if self._closed:
+                return
+
+            self._drain_events()
+            if self._cancel_requested:
+                self._cancel_requested = False
+                self._first_event_ns = None
+                self._deadline_ns = None
+
+            if self._deadline_ns is None:
+                timeout = None
+                continue
+
+            now_ns = time.monotonic_ns()
+            if now_ns < self._deadline_ns:
+                timeout = (self._deadline_ns - now_ns) / 1_000_000_000
+                continue
+
+            if now_ns - self._first_event_ns >= self._max_wait_ns:
+                self.logger.info("Max wait exceeded, forcing sync")
+            self._trigger_callback()
+            timeout = None
+
     def _trigger_callback(self) -> None:
         """Trigger the sync callback with accumulated changes."""
-        with self._lock:
-            self._first_event = None
-            self._last_event = None
-            self._timer = None
-            # Take a snapshot of changes and clear
-            changes = ChangeSet(
-                created=self._changes.created.copy(),
-                modified=self._changes.modified.copy(),
-                deleted=self._changes.deleted.copy(),
-                renamed=self._changes.renamed.copy(),
-            )
-            self._changes.clear()
+        self._batch_generation += 1
+        self._first_event_ns = None
+        self._deadline_ns = None
+        # Hand off the accumulated changes and start a fresh set
+        changes, self._changes = self._changes, ChangeSet()
+        self._rename_origins.clear()
 
         self.logger.info(
             f"Quiet period reached, triggering sync "
@@ -222,11 +315,15 @@ class DebouncedHandler(FileSystemEventHandler):
             self.logger.error(f"Callback error: {e}")
 
     def cancel(self) -> None:
-        """Cancel any pending timer."""
-        with self._lock:
-            if self._timer:
-                self._timer.cancel()
-                self._timer = None
+        """Cancel any pending sync."""
+        # The worker owns the deadline; ask it to drop the pending one
+        self._cancel_requested = True
+        self._wake.set()
+
+    def close(self) -> None:
+        """Cancel any pending sync and stop the worker thread."""
+        self._closed = True
+        self.cancel()
 
 
 class DebouncedWatcher:
@@ -275,8 +372,62 @@ class DebouncedWatcher:
             ignore_patterns=ignore_patterns,
         )
         self._watch_paths: list[Path] = []
+        self._root_strs: set[str] = set()
+        # Recursive watch per top-level directory, by path. A watch stops for
+        # good when its directory goes away, so it is dropped then and a
+        # fresh one scheduled if the directory comes back.
+        self._dir_watches: dict[str, ObservedWatch] = {}
         self._running = False
         self.logger = get_logger("dgmt.watcher")
+        self._handler.on_directory_added = self._on_directory_added
+        self._handler.on_directory_removed = self._on_directory_removed
+
+    def _schedule_path(self, path: Path) -> None:
+        """
+        Schedule watches for a root without descending into ignored subtrees.
+
+        The root itself is watched non-recursively (top-level files), and each
+        non-ignored top-level directory recursively, so .git/.obsidian and
+        friends never get watch descriptors or deliver events at all.
+        """
+        root = str(path)
+        self._root_strs.add(root)
+        self._observer.schedule(self._handler, root, recursive=False)
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir() and not self._handler._should_ignore(entry.name):
+                        self._watch_directory(entry.path)
+        except OSError as e:
+            self.logger.warning(f"Could not list {root}: {e}")
+
+    def _on_directory_added(self, path: str) -> bool:
+        """Watch a directory newly created directly under a root."""
+        if os.path.dirname(path) not in self._root_strs:
+            return False
+        self._watch_directory(path)
+        self.logger.debug("Now watching new directory: %s", path)
+        return True
+
+    def _on_directory_removed(self, path: str) -> None:
+        """Drop the watch of a top-level directory that was deleted or moved away."""
+        watch = self._dir_watches.pop(path, None)
+        if watch is None:
+            return
+        try:
+            self._observer.unschedule(watch)
+        except KeyError:
+            pass  # Already unscheduled
+        self.logger.debug("Stopped watching removed directory: %s", path)
+
+    def _watch_directory(self, path: str) -> None:
+        """Schedule a fresh recursive watch for a top-level directory."""
+        # schedule() hands back the existing watch for a path it already
+        # knows, whose emitter may have died with the old directory
+        self._on_directory_removed(path)
+        self._dir_watches[path] = self._observer.schedule(
+            self._handler, path, recursive=True
+        )
 
     def watch(self, path: str | Path) -> DebouncedWatcher:
         """
@@ -292,7 +443,7 @@ class DebouncedWatcher:
         if path.exists():
             self._watch_paths.append(path)
             if self._running:
-                self._observer.schedule(self._handler, str(path), recursive=True)
+                self._schedule_path(path)
                 self.logger.info(f"Now watching: {path}")
         else:
             self.logger.warning(f"Path does not exist: {path}")
@@ -323,12 +474,21 @@ class DebouncedWatcher:
             return self
 
         for path in self._watch_paths:
-            self._observer.schedule(self._handler, str(path), recursive=True)
+            self._schedule_path(path)
             self.logger.info(f"Watching: {path}")
 
         self._observer.start()
         self._running = True
-        self.logger.info("File watcher started")
+
+        # watchdog picks the native API (inotify, FSEvents, ReadDirectoryChangesW)
+        # and only degrades to stat-polling the whole tree when none is available
+        observer_kind = type(self._observer).__name__
+        if "Polling" in observer_kind:
+            self.logger.warning(
+                f"Using {observer_kind}: no native file event API available, "
+                "watched trees will be re-scanned periodically"
+            )
+        self.logger.info(f"File watcher started ({observer_kind})")
         return self
 
     def stop(self) -> None:
@@ -336,7 +496,7 @@ class DebouncedWatcher:
         if not self._running:
             return
 
-        self._handler.cancel()
+        self._handler.close()
         self._observer.stop()
         self._observer.join(timeout=5)
         self._running = False
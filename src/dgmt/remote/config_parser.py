@@ -7,6 +7,15 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+# "Key value" lines of an ssh config file.
+_OPTION_RE = re.compile(r"^\s*(\w+)\s+(.+)$")
+
+# Parsed hosts keyed by (path, st_mtime_ns, st_size). Every SSHConnection
+# builds a parser, so this keeps one command from re-reading the file for
+# each connection while still picking up edits. Cached SSHHost objects are
+# shared between parsers and must not be modified in place.
+_PARSE_CACHE: dict[tuple[str, int, int], dict[str, SSHHost]] = {}
+
 
 @dataclass
 class SSHHost:
@@ -60,8 +69,16 @@ class SSHConfigParser:
         self._parse()
 
     def _parse(self) -> None:
-        """Parse the SSH config file."""
-        if not self._config_path.exists():
+        """Parse the SSH config file (or reuse an unchanged earlier parse)."""
+        try:
+            st = self._config_path.stat()
+        except OSError:
+            return
+
+        cache_key = (str(self._config_path), st.st_mtime_ns, st.st_size)
+        cached = _PARSE_CACHE.get(cache_key)
+        if cached is not None:
+            self._hosts = cached
             return
 
         try:
@@ -79,7 +96,7 @@ class SSHConfigParser:
                 continue
 
             # Parse key-value pairs
-            match = re.match(r"^\s*(\w+)\s+(.+)$", line, re.IGNORECASE)
+            match = _OPTION_RE.match(line)
             if not match:
                 continue
 
@@ -121,6 +138,10 @@ class SSHConfigParser:
             else:
                 current_host.other_options[key] = value
 
+        for stale in [k for k in _PARSE_CACHE if k[0] == cache_key[0]]:
+            del _PARSE_CACHE[stale]
+        _PARSE_CACHE[cache_key] = self._hosts
+
     def get_host(self, alias: str) -> Optional[SSHHost]:
         """
         Get SSH host configuration by alias.
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Optional
 
+from dgmt.remote.config_parser import SSHHost
 from dgmt.remote.ssh import SSHConnection
 from dgmt.utils.logging import get_logger
 
@@ -13,15 +14,16 @@ class RemoteSetup:
     Handles installation and setup of dgmt on remote machines.
     """
 
-    def __init__(self, host: str) -> None:
+    def __init__(self, host: str, resolved: Optional[SSHHost] = None) -> None:
         """
         Initialize remote setup for a host.
 
         Args:
             host: SSH host alias or hostname.
+            resolved: Host already resolved from SSH config, if available.
         """
         self._host = host
-        self._ssh = SSHConnection(host)
+        self._ssh = SSHConnection(host, resolved=resolved)
         self._logger = get_logger("dgmt.remote.setup")
 
     def check_python(self) -> Optional[str]:
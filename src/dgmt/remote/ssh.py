@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import subprocess
-import sys
+from dataclasses import replace
 from pathlib import Path
 from typing import Optional, Tuple
 
 from dgmt.remote.config_parser import SSHConfigParser, SSHHost
 from dgmt.utils.logging import get_logger
+from dgmt.utils.proc import SUBPROCESS_ARGS
 
 
 class SSHConnection:
@@ -24,6 +25,7 @@ class SSHConnection:
         user: Optional[str] = None,
         port: Optional[int] = None,
         identity_file: Optional[str] = None,
+        resolved: Optional[SSHHost] = None,
     ) -> None:
         """
         Initialize SSH connection.
@@ -36,12 +38,16 @@ class SSHConnection:
             user: SSH username (overrides config).
             port: SSH port (overrides config).
             identity_file: Path to private key (overrides config).
+            resolved: Host already resolved by the caller's SSHConfigParser,
+                to skip looking it up again.
         """
         self._logger = get_logger("dgmt.ssh")
 
-        # Resolve host from SSH config
-        config = SSHConfigParser()
-        self._host_config = config.resolve(host)
+        # Resolve host from SSH config. Copy it, since the overrides below
+        # must not leak into the parser's shared host entries.
+        if resolved is None:
+            resolved = SSHConfigParser().resolve(host)
+        self._host_config = replace(resolved, other_options=dict(resolved.other_options))
 
         # Override with explicit parameters
         if user:
@@ -71,18 +77,6 @@ class SSHConnection:
         """Get the SSH port."""
         return self._host_config.port
 
-    def _get_subprocess_args(self) -> dict:
-        """Get platform-specific subprocess arguments."""
-        if sys.platform == "win32":
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = 0
-            return {
-                "startupinfo": startupinfo,
-                "creationflags": subprocess.CREATE_NO_WINDOW,
-            }
-        return {}
-
     def _build_ssh_cmd(self, command: Optional[str] = None) -> list[str]:
         """Build the SSH command with all options."""
         cmd = ["ssh"]
@@ -128,7 +122,7 @@ class SSHConnection:
                 capture_output=True,
                 text=True,
                 timeout=timeout + 5,
-                **self._get_subprocess_args(),
+                **SUBPROCESS_ARGS,
             )
             return result.returncode == 0 and "ok" in result.stdout
         except Exception as e:
@@ -165,7 +159,7 @@ class SSHConnection:
             capture_output=True,
             text=True,
             timeout=timeout,
-            **self._get_subprocess_args(),
+            **SUBPROCESS_ARGS,
         )
 
         if check and result.returncode != 0:
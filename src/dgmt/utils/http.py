@@ -0,0 +1,40 @@
+"""Shared HTTP session for talking to local services (Syncthing, rclone rcd)."""
+
+from __future__ import annotations
+
+import atexit
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Get the process-wide keep-alive session.
+
+    One connection pool is shared by every subsystem instead of each client
+    allocating its own. Per-client state (API keys, basic auth) is passed
+    per request rather than set on the session. Connection hiccups to the
+    local services are retried twice with a short backoff.
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=8,
+                    max_retries=Retry(total=2, backoff_factor=0.1),
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                atexit.register(session.close)
+                _SESSION = session
+    return _SESSION
@@ -0,0 +1,91 @@
+"""Minimal Linux inotify wrapper (stdlib only, via ctypes)."""
+
+from __future__ import annotations
+
+import ctypes
+import os
+import selectors
+import struct
+import sys
+from pathlib import Path
+from typing import Iterator, Optional
+
+IN_MODIFY = 0x00000002
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+
+# struct inotify_event: int wd; uint32 mask, cookie, len; char name[len]
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _libc() -> Optional[ctypes.CDLL]:
+    """Load libc if it exposes inotify."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+def file_wakeups(path: Path) -> Optional[Iterator[None]]:
+    """
+    Watch a file for writes, truncation, creation and renames.
+
+    The watch is placed on the parent directory so that a file replaced by
+    rotation keeps being tracked under the same name. The returned iterator
+    blocks in a selector (epoll) until the kernel reports an event for the
+    file, then yields; an idle file costs no wakeups at all.
+
+    Args:
+        path: File to watch (it need not exist yet).
+
+    Returns:
+        An endless iterator, or None if inotify is not available here.
+    """
+    libc = _libc()
+    if libc is None:
+        return None
+
+    fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if fd < 0:
+        return None
+    mask = IN_MODIFY | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    if libc.inotify_add_watch(fd, os.fsencode(path.parent), mask) < 0:
+        os.close(fd)
+        return None
+
+    return _wakeups(fd, os.fsencode(path.name))
+
+
+def _wakeups(fd: int, name: bytes) -> Iterator[None]:
+    """Yield once per batch of inotify events that mention name."""
+    try:
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            while True:
+                selector.select()
+                try:
+                    data = os.read(fd, 64 * 1024)
+                except BlockingIOError:
+                    continue
+
+                offset = 0
+                hit = False
+                while offset < len(data):
+                    _, event_mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                    offset += _EVENT_HEADER.size
+                    event_name = data[offset:offset + length].rstrip(b"\0")
+                    offset += length
+                    if event_mask & IN_Q_OVERFLOW or event_name == name:
+                        hit = True
+                if hit:
+                    yield
+    finally:
+        os.close(fd)
@@ -0,0 +1,31 @@
+"""JSON encoding and decoding for dgmt's state and config files."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+# orjson (optional, `pip install dgmt[fast]`) parses several times faster
+# than the stdlib and works on bytes directly; fall back to json otherwise.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+# need to catch the latter.
+try:
+    import orjson
+
+    def loads(data: bytes) -> Any:
+        """Decode JSON from bytes."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Encode obj as indented JSON bytes, ending in a newline."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+except ImportError:
+
+    def loads(data: bytes) -> Any:
+        """Decode JSON from bytes."""
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Encode obj as indented JSON bytes, ending in a newline."""
+        return (json.dumps(obj, indent=2) + "\n").encode()
@@ -1,11 +1,18 @@
 """Logging setup utilities."""
 
 import logging
+import threading
 from pathlib import Path
 from typing import Optional
 
 from dgmt.utils.paths import ensure_parent_exists
 
+# Loggers already configured by setup_logging, keyed by (name, log file,
+# level); a repeat call with the same settings (e.g. a second Daemon in the
+# same process) returns the logger as-is instead of rebuilding its handlers
+_CONFIGURED: dict[tuple[str, Optional[Path], str], logging.Logger] = {}
+_CONFIGURED_LOCK = threading.Lock()
+
 
 def setup_logging(
     log_file: Optional[Path] = None,
@@ -23,11 +30,30 @@ def setup_logging(
     Returns:
         Configured logger instance.
     """
+    key = (name, log_file, level.upper())
+    with _CONFIGURED_LOCK:
+        logger = _CONFIGURED.get(key)
+        # Handlers can be removed behind our back (logging.shutdown(),
+        # tests clearing them); reconfigure rather than log into nothing
+        if logger is not None and logger.handlers:
+            return logger
+        logger = _configure(name, log_file, key[2])
+        # Only the latest settings for a name are live
+        for stale in [k for k in _CONFIGURED if k[0] == name]:
+            del _CONFIGURED[stale]
+        _CONFIGURED[key] = logger
+        return logger
+
+
+def _configure(name: str, log_file: Optional[Path], level: str) -> logging.Logger:
+    """Replace a logger's handlers with console (and file) handlers."""
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(getattr(logging, level))
 
-    # Clear existing handlers to avoid duplicates
-    logger.handlers.clear()
+    # Drop existing handlers to avoid duplicates, closing their files
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.close()
 
     formatter = logging.Formatter(
         "[%(asctime)s] %(levelname)s: %(message)s",
@@ -1,5 +1,6 @@
 """Path expansion and validation utilities."""
 
+import os
 from pathlib import Path
 from typing import Union
 
@@ -36,3 +37,36 @@ def get_config_file() -> Path:
 def get_log_file() -> Path:
     """Get the default log file path."""
     return get_config_dir() / "dgmt.log"
+
+
+def tree_signature(path: Union[str, Path]) -> tuple[int, int, int]:
+    """
+    Cheaply fingerprint a local tree as (file count, total size, digest).
+
+    The digest XORs a hash of each file's path, size and mtime, so edits,
+    additions, deletions and renames all change it. Uses os.scandir, whose
+    DirEntry caches stat results, so no file is opened. String hashing is
+    salted per process, so signatures are only comparable within one run.
+    """
+    count = 0
+    total_size = 0
+    digest = 0
+    stack = [os.fspath(path)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    count += 1
+                    total_size += st.st_size
+                    digest ^= hash((entry.path, st.st_size, st.st_mtime_ns))
+        except OSError:
+            continue
+    return count, total_size, digest
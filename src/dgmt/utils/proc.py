@@ -0,0 +1,119 @@
+"""Subprocess helpers."""
+
+from __future__ import annotations
+
+import logging
+import subprocess
+import sys
+import threading
+from collections import deque
+from typing import IO, Callable, Optional, Sequence
+
+# Popen keyword arguments for dgmt's helper processes, built once per
+# process. On Windows, hide the console window (Popen copies startupinfo,
+# so one instance can be shared). Elsewhere, skip the close-all-fds walk in
+# the child: Python's own descriptors are non-inheritable (PEP 446), and it
+# lets CPython use its posix_spawn/vfork fast path.
+if sys.platform == "win32":
+    _startupinfo = subprocess.STARTUPINFO()
+    _startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _startupinfo.wShowWindow = 0
+    SUBPROCESS_ARGS: dict = {
+        "startupinfo": _startupinfo,
+        "creationflags": subprocess.CREATE_NO_WINDOW,
+    }
+else:
+    SUBPROCESS_ARGS = {"close_fds": False}
+
+
+def _pump(
+    pipe: IO[str],
+    tail: deque[str],
+    logger: Optional[logging.Logger],
+    on_line: Optional[Callable[[str], None]],
+) -> None:
+    """Drain a pipe line by line into a bounded tail (and the debug log)."""
+    with pipe:
+        for line in pipe:
+            line = line.rstrip("\r\n")
+            tail.append(line)
+            if logger is not None:
+                logger.debug("%s", line)
+            if on_line is not None:
+                on_line(line)
+
+
+def run_streaming(
+    cmd: Sequence[str],
+    timeout: Optional[float] = None,
+    tail_lines: int = 512,
+    logger: Optional[logging.Logger] = None,
+    on_line: Optional[Callable[[str], None]] = None,
+    **popen_kwargs,
+) -> subprocess.CompletedProcess:
+    """
+    Run a command, keeping only the last lines of its output.
+
+    Unlike ``subprocess.run(capture_output=True)``, memory stays bounded no
+    matter how much the command prints (e.g. a verbose rclone --resync).
+    stdout and stderr are each drained by a reader thread into their own
+    ``deque(maxlen=tail_lines)``, so neither pipe can fill up and block the
+    child.
+
+    Args:
+        cmd: Command and arguments.
+        timeout: Seconds before the process is killed.
+        tail_lines: Number of trailing lines to keep per stream.
+        logger: If given, every output line is logged at DEBUG.
+        on_line: Called with every output line as it arrives (from a reader
+            thread), e.g. to scan for errors that may scroll out of the tail.
+        **popen_kwargs: Extra arguments for Popen (e.g. startupinfo).
+
+    Returns:
+        CompletedProcess with the output tails in ``stdout``/``stderr``.
+
+    Raises:
+        subprocess.TimeoutExpired: If the command ran past the timeout.
+    """
+    if logger is not None and not logger.isEnabledFor(logging.DEBUG):
+        logger = None
+
+    out_tail: deque[str] = deque(maxlen=tail_lines)
+    err_tail: deque[str] = deque(maxlen=tail_lines)
+
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        **popen_kwargs,
+    )
+    readers = [
+        threading.Thread(
+            target=_pump, args=(proc.stdout, out_tail, logger, on_line), daemon=True
+        ),
+        threading.Thread(
+            target=_pump, args=(proc.stderr, err_tail, logger, on_line), daemon=True
+        ),
+    ]
+    for reader in readers:
+        reader.start()
+
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        for reader in readers:
+            reader.join(timeout=1)
+        raise subprocess.TimeoutExpired(
+            cmd, timeout, output="\n".join(out_tail), stderr="\n".join(err_tail)
+        )
+
+    for reader in readers:
+        reader.join()
+    return subprocess.CompletedProcess(
+        cmd, returncode, "\n".join(out_tail), "\n".join(err_tail)
+    )
@@ -0,0 +1,54 @@
+"""Concurrency tests for RcloneBackend.sync coalescing."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from dgmt.backends.rclone import RcloneBackend
+
+
+def _slow_backend(calls: list[str], delay: float = 0.2) -> RcloneBackend:
+    """An RcloneBackend whose bisync just sleeps and records the path."""
+    backend = RcloneBackend(use_rcd=False)
+
+    def fake_do_sync(local_path: str, remote_path: str | None) -> bool:
+        calls.append(local_path)
+        time.sleep(delay)
+        return True
+
+    backend._do_sync = fake_do_sync
+    return backend
+
+
+def test_concurrent_same_path_syncs_all_return() -> None:
+    calls: list[str] = []
+    backend = _slow_backend(calls)
+    results: list[bool] = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(backend.sync("/vault")))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.02)
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert results == [True] * 5
+    # One running bisync plus one coalesced follow-up for the rest
+    assert len(calls) == 2
+    backend.close()
+
+
+def test_concurrent_same_path_sync_async_completes() -> None:
+    calls: list[str] = []
+    backend = _slow_backend(calls)
+
+    futures = [backend.sync_async("/vault") for _ in range(5)]
+
+    assert [future.result(timeout=5) for future in futures] == [True] * 5
+    assert 2 <= len(calls) < 5
+    backend.close()
@@ -0,0 +1,63 @@
+"""Tests for DebouncedWatcher's per-directory watches."""
+
+from __future__ import annotations
+
+import shutil
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("watchdog")
+
+from dgmt.core.watcher import ChangeSet, DebouncedWatcher
+
+
+class _Collector:
+    """Callback that records every batch and lets tests wait for a path."""
+
+    def __init__(self) -> None:
+        self.paths: set[str] = set()
+        self._changed = threading.Condition()
+
+    def __call__(self, changes: ChangeSet) -> None:
+        with self._changed:
+            self.paths |= changes.created | changes.modified
+            self._changed.notify_all()
+
+    def wait_for(self, path: Path, timeout: float = 5.0) -> bool:
+        with self._changed:
+            return self._changed.wait_for(lambda: str(path) in self.paths, timeout)
+
+
+def test_recreated_top_level_directory_is_watched(tmp_path: Path) -> None:
+    notes = tmp_path / "notes"
+    notes.mkdir()
+    collector = _Collector()
+
+    with DebouncedWatcher(collector, debounce_seconds=0.1).watch(tmp_path):
+        shutil.rmtree(notes)
+        time.sleep(0.3)
+        notes.mkdir()
+        time.sleep(0.3)
+
+        note = notes / "todo.md"
+        note.write_text("first")
+        assert collector.wait_for(note)
+
+
+def test_directory_renamed_away_and_back_is_watched(tmp_path: Path) -> None:
+    notes = tmp_path / "notes"
+    notes.mkdir()
+    collector = _Collector()
+
+    with DebouncedWatcher(collector, debounce_seconds=0.1).watch(tmp_path):
+        notes.rename(tmp_path / "notes-old")
+        time.sleep(0.3)
+        (tmp_path / "notes-old").rename(notes)
+        time.sleep(0.3)
+
+        note = notes / "todo.md"
+        note.write_text("first")
+        assert collector.wait_for(note)